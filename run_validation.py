@@ -8,78 +8,163 @@ import os
 import sys
 import time
 import asyncio
-import json
-import yaml
-from datetime import datetime, timedelta
+import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
-# Add src to Python path BUT DO NOT import StreamingService yet
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-import logging
+# Add src to Python path BUT DO NOT import StreamingService yet.
+# Only when run as a script: library importers (run_validation_test.py) set it up themselves.
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Setup logging (no thread/process lookups per record).
+# Records go through a queue; a listener thread does the stdout writes so
+# logging never blocks the event loop while StreamingService is running.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# Criterios de aceptación OPA-265
+DURATION_TARGET = 3600  # segundos
+DURATION_TOLERANCE = 0.95  # 95% tolerance
+QUOTES_TARGET = 1000
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Arranca el hilo que escribe en stdout los registros encolados.
+    
+    Se llama desde main() (no al importar), que lo detiene en su `finally`.
+    Los registros emitidos antes quedan en la cola y se escriben al arrancar.
+    
+    Returns:
+        Listener arrancado
+    """
+    listener = logging.handlers.QueueListener(
+        _log_queue, _stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
+
+def _load_config_cached(path: Path) -> dict:
+    """Carga YAML usando un sidecar JSON cacheado por mtime.
+    
+    Si `<archivo>.yaml.cache.json` existe y no es más antiguo que el YAML,
+    se lee directamente; si no, se parsea el YAML y se regenera la caché
+    de forma atómica (tmp + os.replace). Solo se escribe caché cuando la
+    configuración es idéntica tras pasar por JSON, para que una lectura
+    cacheada devuelva lo mismo que un parseo nuevo.
+    
+    Args:
+        path: Ruta al archivo YAML
+        
+    Returns:
+        Configuración parseada
+    """
+    import json
+    
+    cache = path.with_suffix(path.suffix + ".cache.json")
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        with open(cache, 'r') as f:
+            return json.load(f)
+    
+    import yaml
+    
+    # libyaml-backed loader when available (same semantics as safe_load)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=loader)
+    
+    # Solo cachear si la configuración sobrevive sin cambios a JSON: tipos
+    # exclusivos de YAML (fechas, claves no string...) volverían distintos
+    try:
+        text = json.dumps(config)
+        cacheable = json.loads(text) == config
+    except (TypeError, ValueError):
+        cacheable = False
+    if not cacheable:
+        logger.debug("Configuración %s no representable en JSON, sin caché", path)
+        return config
+    
+    tmp = cache.with_suffix(".tmp")
+    try:
+        with open(tmp, 'w') as f:
+            f.write(text)
+        os.replace(tmp, cache)
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        logger.debug("No se pudo escribir caché %s: %s", cache, e)
+    return config
+
 
 class ValidationRunner:
     """Ejecuta validación de streaming y genera reportes."""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, config: dict | None = None):
         """
         Args:
             config_path: Ruta al archivo streaming.yaml
+            config: Configuración ya parseada (evita volver a leer el archivo)
         """
         self.config_path = config_path
-        self.config = self._load_config()
+        self.config = config if config is not None else self._load_config()
         self.start_time = None
+        self.report_path = None
+        self._mono_start = None
         self.service = None
         
     def _load_config(self) -> dict:
         """Carga configuración desde YAML."""
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        logger.info(f"Configuración cargada desde {self.config_path}")
+        config = _load_config_cached(Path(self.config_path))
+        logger.info("Configuración cargada desde %s", self.config_path)
         return config
     
     def _set_environment(self):
         """Configura variables de entorno desde YAML."""
-        source_config = self.config['sources']['yahoo_finance']
-        
-        # Set tickers
-        tickers = ','.join(source_config['tickers'])
-        os.environ['TICKERS'] = tickers
+        config = self.config
+        src = config['sources']['yahoo_finance']
+        tickers = src['tickers']
         
-        # Set intervals and limits
-        os.environ['POLLING_INTERVAL'] = str(source_config['fetch_interval'])
-        os.environ['MAX_REQUESTS_PER_HOUR'] = '2000'  # Safe limit for 100 tickers
+        # Tickers, intervals and limits
+        env = {
+            'TICKERS': ','.join(tickers),
+            'POLLING_INTERVAL': str(src['fetch_interval']),
+            'MAX_REQUESTS_PER_HOUR': '2000',  # Safe limit for 100 tickers
+            'PUBLISHER_ENABLED': 'false',
+        }
         
         # Storage configuration
-        if 'publishers' in self.config:
-            pub_config = self.config['publishers']['storage']
-            os.environ['STORAGE_API_URL'] = pub_config['endpoint']
-            os.environ['STORAGE_TIMEOUT'] = str(pub_config['timeout'])
-            os.environ['PUBLISHER_ENABLED'] = str(pub_config.get('enabled', True)).lower()
-        else:
-            os.environ['PUBLISHER_ENABLED'] = 'false'
+        if 'publishers' in config:
+            pub_config = config['publishers']['storage']
+            env.update({
+                'STORAGE_API_URL': pub_config['endpoint'],
+                'STORAGE_TIMEOUT': str(pub_config['timeout']),
+                'PUBLISHER_ENABLED': str(pub_config.get('enabled', True)).lower(),
+            })
         
         # Metrics
-        if 'metrics' in self.config:
-            metrics_config = self.config['metrics']
-            os.environ['METRICS_PORT'] = str(metrics_config['port'])
+        if 'metrics' in config:
+            env['METRICS_PORT'] = str(config['metrics']['port'])
         
         # Logging
-        if 'logging' in self.config:
-            log_config = self.config['logging']
-            os.environ['LOG_LEVEL'] = log_config['level']
+        if 'logging' in config:
+            env['LOG_LEVEL'] = config['logging']['level']
+        
+        os.environ.update(env)
         
-        logger.info(f"Configurados {len(source_config['tickers'])} tickers")
-        logger.info(f"Intervalo de polling: {source_config['fetch_interval']}s")
-        logger.info(f"Publisher enabled: {os.environ.get('PUBLISHER_ENABLED', 'true')}")
+        logger.info("Configurados %d tickers", len(tickers))
+        logger.info("Intervalo de polling: %ss", src['fetch_interval'])
+        logger.info("Publisher enabled: %s", env['PUBLISHER_ENABLED'])
     
     async def run_validation(self, duration_seconds: int):
         """
@@ -88,12 +173,18 @@ class ValidationRunner:
         Args:
             duration_seconds: Duración en segundos (3600 para 1 hora)
         """
-        logger.info(f"=== Iniciando Validación OPA-265 ===")
-        logger.info(f"Duración: {duration_seconds}s ({duration_seconds/60:.0f} minutos)")
-        logger.info(f"Tickers: {len(self.config['sources']['yahoo_finance']['tickers'])}")
+        from datetime import datetime
+        
+        logger.info("=== Iniciando Validación OPA-265 ===")
+        logger.info("Duración: %ss (%.0f minutos)", duration_seconds, duration_seconds / 60)
+        logger.info("Tickers: %d", len(self.config['sources']['yahoo_finance']['tickers']))
         
         self.start_time = datetime.now()
-        end_time = self.start_time + timedelta(seconds=duration_seconds)
+        self._mono_start = time.monotonic()
+        
+        # Ruta del reporte conocida desde el inicio (aunque el proceso muera)
+        self.report_path = Path("logs") / f"validation_report_{self.start_time:%Y%m%d_%H%M%S}.json"
+        self.report_path.parent.mkdir(exist_ok=True)
         
         # Set environment BEFORE importing StreamingService
         self._set_environment()
@@ -104,103 +195,143 @@ class ValidationRunner:
         # Create service (will load fresh settings with env vars)
         self.service = StreamingService()
         
-        # Create task with timeout
-        streaming_task = asyncio.create_task(self.service.start())
-        
+        # Run until the deadline expires or the service stops on its own.
+        # stream_loop absorbe la cancelación y start() retorna normalmente,
+        # así que el fin por tiempo se detecta con deadline.expired()
+        deadline = asyncio.timeout(duration_seconds)
         try:
-            # Wait for duration or until service stops
-            await asyncio.wait_for(streaming_task, timeout=duration_seconds)
-        except asyncio.TimeoutError:
-            logger.info("Tiempo de validación completado")
-            await self.service.stop()
+            try:
+                async with deadline:
+                    await self.service.start()
+            except TimeoutError:
+                if not deadline.expired():
+                    raise
+            if deadline.expired():
+                logger.info("Tiempo de validación completado")
         except Exception as e:
-            logger.error(f"Error durante validación: {e}", exc_info=True)
-            await self.service.stop()
+            # Traceback completo solo en DEBUG; main() ya lo registra al propagarse
+            logger.error(
+                "Error durante validación: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             raise
+        finally:
+            # Cierra siempre clientes HTTP/Redis y la tarea de health check
+            await self.service.stop()
         
         # Generate report
         self._generate_report()
     
     def _generate_report(self):
         """Genera reporte final de validación."""
+        from datetime import datetime
+        
+        # Duración con reloj monotónico (inmune a ajustes NTP); datetime solo para timestamps
+        elapsed = time.monotonic() - self._mono_start
         end_time = datetime.now()
-        duration = end_time - self.start_time
+        
+        src = self.config['sources']['yahoo_finance']
+        service = self.service
+        quotes_fetched = service.total_quotes_fetched
+        quotes_published = service.total_quotes_published
+        quotes_per_minute = quotes_published / (elapsed / 60)
+        
+        acceptance = {
+            "duration_target": DURATION_TARGET,
+            "duration_achieved": elapsed,
+            "duration_ok": elapsed >= DURATION_TARGET * DURATION_TOLERANCE,
+            "quotes_target": QUOTES_TARGET,
+            "quotes_achieved": quotes_published,
+            "quotes_ok": quotes_published >= QUOTES_TARGET
+        }
         
         report = {
             "validation_id": "OPA-265",
-            "start_time": self.start_time.isoformat(),
-            "end_time": end_time.isoformat(),
-            "duration_seconds": duration.total_seconds(),
-            "duration_minutes": duration.total_seconds() / 60,
+            "start_time": self.start_time,
+            "end_time": end_time,
+            "duration_seconds": elapsed,
+            "duration_minutes": elapsed / 60,
             "configuration": {
-                "tickers_count": len(self.config['sources']['yahoo_finance']['tickers']),
-                "fetch_interval": self.config['sources']['yahoo_finance']['fetch_interval'],
-                "batch_size": self.config['sources']['yahoo_finance']['batch_size']
+                "tickers_count": len(src['tickers']),
+                "fetch_interval": src['fetch_interval'],
+                "batch_size": src['batch_size']
             },
             "metrics": {
-                "total_quotes_fetched": self.service.total_quotes_fetched,
-                "total_quotes_published": self.service.total_quotes_published,
-                "total_cycles": self.service.cycle_count,
-                "quotes_per_minute": self.service.total_quotes_published / (duration.total_seconds() / 60)
+                "total_quotes_fetched": quotes_fetched,
+                "total_quotes_published": quotes_published,
+                "total_cycles": service.cycle_count,
+                "quotes_per_minute": quotes_per_minute
             },
-            "acceptance_criteria": {
-                "duration_target": 3600,
-                "duration_achieved": duration.total_seconds(),
-                "duration_ok": duration.total_seconds() >= 3600 * 0.95,  # 95% tolerance
-                "quotes_target": 1000,
-                "quotes_achieved": self.service.total_quotes_published,
-                "quotes_ok": self.service.total_quotes_published >= 1000
-            }
+            "acceptance_criteria": acceptance
         }
         
         # Save report
-        report_path = Path("logs") / f"validation_report_{self.start_time.strftime('%Y%m%d_%H%M%S')}.json"
-        report_path.parent.mkdir(exist_ok=True)
+        report_path = self.report_path
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        try:
+            import orjson
+        except ImportError:
+            import json
+            with open(report_path, 'w') as f:
+                json.dump(report, f, indent=2, default=datetime.isoformat)
+        else:
+            # orjson serializa datetime nativamente (ISO 8601)
+            report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
         
         logger.info(f"\n{'='*60}")
         logger.info(f"=== REPORTE DE VALIDACIÓN OPA-265 ===")
         logger.info(f"{'='*60}")
-        logger.info(f"Duración: {duration.total_seconds():.0f}s ({duration.total_seconds()/60:.1f} min)")
-        logger.info(f"Ciclos completados: {self.service.cycle_count}")
-        logger.info(f"Quotes fetched: {self.service.total_quotes_fetched}")
-        logger.info(f"Quotes publicadas: {self.service.total_quotes_published}")
-        logger.info(f"Quotes/min: {report['metrics']['quotes_per_minute']:.1f}")
+        logger.info(f"Duración: {elapsed:.0f}s ({elapsed/60:.1f} min)")
+        logger.info(f"Ciclos completados: {service.cycle_count}")
+        logger.info(f"Quotes fetched: {quotes_fetched}")
+        logger.info(f"Quotes publicadas: {quotes_published}")
+        logger.info(f"Quotes/min: {quotes_per_minute:.1f}")
         logger.info(f"\nCriterios de Aceptación:")
-        logger.info(f"  ✓ Duración ≥1h: {'SÍ' if report['acceptance_criteria']['duration_ok'] else 'NO'}")
-        logger.info(f"  ✓ Quotes >1000: {'SÍ' if report['acceptance_criteria']['quotes_ok'] else 'NO'}")
+        logger.info(f"  ✓ Duración ≥1h: {'SÍ' if acceptance['duration_ok'] else 'NO'}")
+        logger.info(f"  ✓ Quotes >{QUOTES_TARGET}: {'SÍ' if acceptance['quotes_ok'] else 'NO'}")
         logger.info(f"\nReporte guardado: {report_path}")
         logger.info(f"{'='*60}")
 
 
 async def main():
     """Entry point."""
-    config_path = Path(__file__).parent / "config" / "streaming.yaml"
-    
-    if not config_path.exists():
-        logger.error(f"Archivo de configuración no encontrado: {config_path}")
-        sys.exit(1)
-    
-    # Get duration from config or default to 1 hour
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
-    
-    duration = config.get('validation', {}).get('duration', 3600)
-    
-    runner = ValidationRunner(str(config_path))
-    
+    log_listener = _start_log_listener()
+    try:
+        config_path = Path(__file__).parent / "config" / "streaming.yaml"
+        
+        if not config_path.exists():
+            logger.error("Archivo de configuración no encontrado: %s", config_path)
+            sys.exit(1)
+        
+        # Get duration from config or default to 1 hour
+        config = _load_config_cached(config_path)
+        
+        duration = config.get('validation', {}).get('duration', 3600)
+        
+        runner = ValidationRunner(str(config_path), config=config)
+        
+        try:
+            await runner.run_validation(duration_seconds=duration)
+        except KeyboardInterrupt:
+            logger.info("Validación interrumpida por usuario")
+            if runner.service:
+                await runner.service.stop()
+        except Exception as e:
+            logger.error("Error en validación: %s", e, exc_info=True)
+            sys.exit(1)
+    finally:
+        # Flush pending log records before exiting
+        log_listener.stop()
+
+
+def _event_loop_factory():
+    """Devuelve el factory de uvloop si está instalado (extra `speedups`)."""
     try:
-        await runner.run_validation(duration_seconds=duration)
-    except KeyboardInterrupt:
-        logger.info("Validación interrumpida por usuario")
-        if runner.service:
-            await runner.service.stop()
-    except Exception as e:
-        logger.error(f"Error en validación: {e}", exc_info=True)
-        sys.exit(1)
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=_event_loop_factory())
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-Test runner - Uses streaming_test.yaml for quick validation
+Test runner - Quick smoke test (1 minute) over the first 10 tickers of streaming.yaml
+Issue: OPA-265
 """
 import sys
 from pathlib import Path
@@ -8,17 +9,27 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 import asyncio
-from run_validation import ValidationRunner
+from run_validation import ValidationRunner, _event_loop_factory, _load_config_cached, _start_log_listener
 
 async def main():
-    config_path = Path(__file__).parent / "config" / "streaming_test.yaml"
+    config_path = Path(__file__).parent / "config" / "streaming.yaml"
     
     if not config_path.exists():
-        print("ERROR: Test config not found. Run: python create_test_config.py")
+        print(f"ERROR: Config not found: {config_path}")
         sys.exit(1)
     
-    runner = ValidationRunner(str(config_path))
-    await runner.run_validation(duration_seconds=60)
+    # Reduce to 10 tickers / 1 minute in memory (no temp YAML written)
+    config = _load_config_cached(config_path)
+    source_config = config['sources']['yahoo_finance']
+    source_config['tickers'] = source_config['tickers'][:10]
+    config.setdefault('validation', {})['duration'] = 60
+    
+    runner = ValidationRunner(str(config_path), config=config)
+    log_listener = _start_log_listener()
+    try:
+        await runner.run_validation(duration_seconds=60)
+    finally:
+        log_listener.stop()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=_event_loop_factory())
@@ -14,23 +14,31 @@ Métricas capturadas:
 """
 import os
 import sys
-import time
+import functools
+import io
+import threading
 import asyncio
 import json
 import yaml
 import argparse
-import statistics
+import numpy as np
 import psutil
-from datetime import datetime, timedelta
+
+try:
+    from numba import njit
+except ImportError:  # numba es opcional (extra `speedups`)
+    njit = None
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
-from collections import deque
+from typing import List, Dict, Any, Optional, Sequence, TextIO, Tuple
 
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import logging
 
+from opa_quotes_streamer.utils.quantile import StreamingPercentiles
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +46,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Loguear solo 1 de cada N errores de fetch en el benchmark
+ERROR_LOG_EVERY = 50
+
+# Tamaño del historial crudo de latencias (ring buffer)
+LATENCY_HISTORY_SIZE = 10_000
+
+# libyaml-backed loader when available (same semantics as safe_load)
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(path: str, mtime_ns: int) -> dict:
+    """Parsea el YAML; cacheado por (ruta, mtime) para no reparsear."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=Loader)
+
+
+def _count_gaps(ticker_ix, ts_ns, last_ns, threshold_ns):
+    """
+    Cuenta gaps de un batch y actualiza el último timestamp por ticker.
+    
+    Args:
+        ticker_ix: Índice de ticker por quote (int32)
+        ts_ns: Timestamp por quote en ns (int64)
+        last_ns: Último timestamp visto por índice de ticker (int64, 0 = nunca)
+        threshold_ns: Intervalo máximo sin considerar gap (ns)
+        
+    Returns:
+        Número de gaps detectados en el batch
+    """
+    gaps = 0
+    for i in range(ts_ns.shape[0]):
+        t = ts_ns[i]
+        k = ticker_ix[i]
+        if last_ns[k] != 0 and t - last_ns[k] > threshold_ns:
+            gaps += 1
+        last_ns[k] = t
+    return gaps
+
+
+# Kernel compilado con numba si está disponible; si no, se usa la versión Python
+if njit is not None:
+    _count_gaps = njit(cache=True)(_count_gaps)
+
+
+def _load_config_cached(path: str) -> dict:
+    """Carga configuración YAML reutilizando el parseo si el archivo no cambió.
+    
+    El dict devuelto es compartido entre llamadas: tratarlo como solo lectura.
+    """
+    return _parse_config(path, os.stat(path).st_mtime_ns)
+
 
 class BenchmarkRunner:
     """
@@ -52,7 +112,7 @@ class BenchmarkRunner:
     - gaps_detected
     """
     
-    def __init__(self, config_path: str, tickers: List[str] = None):
+    def __init__(self, config_path: str, tickers: Sequence[str] = None):
         """
         Args:
             config_path: Ruta al archivo streaming.yaml base
@@ -60,10 +120,20 @@ class BenchmarkRunner:
         """
         self.config_path = config_path
         self.base_config = self._load_config()
-        self.override_tickers = tickers
-        
-        # Métricas de latencia (rolling window)
-        self.fetch_latencies_ms: deque = deque(maxlen=10000)
+        # Lista de tickers resuelta una sola vez (override o config)
+        self.tickers: List[str] = list(
+            tickers or self.base_config['sources']['yahoo_finance']['tickers']
+        )
+        
+        # Métricas de latencia en ns (perf_counter_ns): estimador P² online
+        # (memoria constante, sin descartar muestras antiguas en benchmarks largos)
+        self.latency_digest = StreamingPercentiles((50, 95, 99))
+        self.total_latency_samples = 0
+        # Historial crudo de las últimas LATENCY_HISTORY_SIZE latencias (ns):
+        # ring buffer int64 preasignado en lugar de una deque de floats
+        self._lat_buf = np.empty(LATENCY_HISTORY_SIZE, dtype=np.int64)
+        self._lat_head = 0
+        self._lat_full = False
         
         # Contadores
         self.total_quotes = 0
@@ -71,31 +141,32 @@ class BenchmarkRunner:
         self.gaps_detected = 0
         self.cycles_completed = 0
         
-        # Resource tracking
-        self.memory_samples: List[float] = []
-        self.cpu_samples: List[float] = []
+        # Resource tracking (hilo daemon con un único psutil.Process)
+        # Buffers float32 preasignados + puntero (se dimensionan en run_benchmark)
+        self.sample_interval_seconds = 5
+        self.memory_samples = np.empty(0, dtype=np.float32)
+        self.cpu_samples = np.empty(0, dtype=np.float32)
+        self._n_samples = 0
+        self._proc = psutil.Process()
+        self._sampler_stop = threading.Event()
         
         # Timing
         self.start_time = None
         self.service = None
         
-        # Gap detection
-        self.last_quote_per_ticker: Dict[str, datetime] = {}
+        # Gap detection: índice fijo por ticker (construido una vez) + último
+        # timestamp (ns) en array int64
+        self._ticker_index: Dict[str, int] = {t: i for i, t in enumerate(self.tickers)}
+        self._last_ns = np.zeros(len(self.tickers), dtype=np.int64)
         self.expected_interval_seconds = 60  # Based on config
+        self._gap_threshold_ns = self.expected_interval_seconds * 2 * 1_000_000_000
+        self._gap_queue: asyncio.Queue = asyncio.Queue()
         
     def _load_config(self) -> dict:
         """Carga configuración base desde YAML."""
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
-    
-    def _get_tickers(self) -> List[str]:
-        """Obtiene lista de tickers (override o config)."""
-        if self.override_tickers:
-            return self.override_tickers
-        return self.base_config['sources']['yahoo_finance']['tickers']
+        return _load_config_cached(self.config_path)
     
-    def _set_environment(self, tickers: List[str]):
+    def _set_environment(self, tickers: Sequence[str]):
         """Configura variables de entorno para el servicio."""
         # Tickers
         os.environ['TICKERS'] = ','.join(tickers)
@@ -121,32 +192,96 @@ class BenchmarkRunner:
     
     def _sample_resources(self):
         """Captura sample de CPU y memoria."""
-        process = psutil.Process()
+        # oneshot() agrupa las lecturas de /proc en una sola
+        with self._proc.oneshot():
+            rss = self._proc.memory_info().rss
+            cpu_percent = self._proc.cpu_percent(interval=None)
+        
+        n = self._n_samples
+        if n >= len(self.memory_samples):
+            # Fuera de la estimación inicial (p.ej. sin run_benchmark): duplicar
+            self._allocate_samples(max(2 * n, 16))
         
         # Memory in MB
-        memory_mb = process.memory_info().rss / (1024 * 1024)
-        self.memory_samples.append(memory_mb)
+        self.memory_samples[n] = rss / (1024 * 1024)
         
         # CPU percent (interval-based)
-        cpu_percent = process.cpu_percent(interval=None)
-        self.cpu_samples.append(cpu_percent)
+        self.cpu_samples[n] = cpu_percent
+        self._n_samples = n + 1
     
-    def _detect_gap(self, ticker: str, quote_time: datetime):
-        """
-        Detecta gap si el intervalo entre quotes es mayor al esperado.
+    def _allocate_samples(self, capacity: int):
+        """Redimensiona los buffers de muestras conservando las existentes."""
+        n = self._n_samples
+        memory = np.empty(capacity, dtype=np.float32)
+        cpu = np.empty(capacity, dtype=np.float32)
+        memory[:n] = self.memory_samples[:n]
+        cpu[:n] = self.cpu_samples[:n]
+        self.memory_samples, self.cpu_samples = memory, cpu
+    
+    def _sample_loop(self):
+        """Loop del hilo de muestreo (fuera del event loop)."""
+        while not self._sampler_stop.is_set():
+            self._sample_resources()
+            self._sampler_stop.wait(self.sample_interval_seconds)
+    
+    def _on_fetch_latency(self, latency_ns: int, n_quotes: int):
+        """Hook de la fuente: latencia (ns) y número de quotes de un fetch exitoso."""
+        self.latency_digest.update(latency_ns)
+        self.total_latency_samples += 1
+        self._lat_buf[self._lat_head] = latency_ns
+        self._lat_head = (self._lat_head + 1) % LATENCY_HISTORY_SIZE
+        self._lat_full = self._lat_full or self._lat_head == 0
+        self.total_quotes += n_quotes
+    
+    def _on_fetch_error(self, error: Exception):
+        """Hook de la fuente: fetch fallido.
         
-        Un gap indica posible pérdida de datos o timeout.
+        La fuente ya registra cada error con traceback; aquí solo se cuenta y
+        se loguea de forma muestreada para no penalizar ráfagas de errores.
         """
-        if ticker in self.last_quote_per_ticker:
-            last_time = self.last_quote_per_ticker[ticker]
-            interval = (quote_time - last_time).total_seconds()
-            
-            # Gap si > 2x intervalo esperado
-            if interval > self.expected_interval_seconds * 2:
-                self.gaps_detected += 1
-                logger.warning(f"Gap detectado para {ticker}: {interval:.0f}s desde última quote")
+        self.total_errors += 1
+        if self.total_errors == 1 or self.total_errors % ERROR_LOG_EVERY == 0:
+            logger.warning("Error en fetch (#%d): %s", self.total_errors, error)
+    
+    def _ticker_ix(self, ticker: str) -> int:
+        """Devuelve el índice del ticker (registrándolo si no estaba en la lista)."""
+        ix = self._ticker_index.get(ticker)
+        if ix is None:
+            ix = self._ticker_index[ticker] = len(self._ticker_index)
+            if ix >= len(self._last_ns):
+                self._last_ns = np.concatenate(
+                    (self._last_ns, np.zeros(max(ix + 1, 16), dtype=np.int64))
+                )
+        return ix
+    
+    def _process_gap_batch(self, quotes: List[Any]):
+        """
+        Detecta gaps en un batch de quotes.
         
-        self.last_quote_per_ticker[ticker] = quote_time
+        Un gap (intervalo > 2x el esperado) indica posible pérdida de datos o timeout.
+        """
+        n = len(quotes)
+        ticker_ix = np.fromiter(
+            (self._ticker_ix(q.ticker) for q in quotes), dtype=np.int32, count=n
+        )
+        ts_ns = np.fromiter(
+            (int(q.timestamp.timestamp() * 1e9) for q in quotes), dtype=np.int64, count=n
+        )
+        gaps = _count_gaps(ticker_ix, ts_ns, self._last_ns, self._gap_threshold_ns)
+        if gaps:
+            self.gaps_detected += gaps
+            logger.warning("Gaps detectados en batch: %d", gaps)
+    
+    async def _gap_worker(self):
+        """Consume batches de quotes y hace la contabilidad de gaps fuera del fetch."""
+        while True:
+            batch = await self._gap_queue.get()
+            self._process_gap_batch(batch)
+    
+    def _drain_gap_queue(self):
+        """Procesa los batches pendientes (al finalizar el benchmark)."""
+        while not self._gap_queue.empty():
+            self._process_gap_batch(self._gap_queue.get_nowait())
     
     async def run_benchmark(self, duration_seconds: int) -> Dict[str, Any]:
         """
@@ -158,7 +293,7 @@ class BenchmarkRunner:
         Returns:
             Diccionario con métricas del benchmark
         """
-        tickers = self._get_tickers()
+        tickers = self.tickers
         logger.info(f"=== Iniciando Benchmark OPA-286 ===")
         logger.info(f"Tickers: {len(tickers)}")
         logger.info(f"Duración objetivo: {duration_seconds}s ({duration_seconds/3600:.1f} horas)")
@@ -166,62 +301,57 @@ class BenchmarkRunner:
         self.start_time = datetime.now()
         self._set_environment(tickers)
         
+        # Un sample cada sample_interval_seconds (+ margen para el inicial/final)
+        self._allocate_samples(duration_seconds // self.sample_interval_seconds + 2)
+        
         # Import after env setup
         from opa_quotes_streamer.main import StreamingService
+        from opa_quotes_streamer.models.quote import Quote
         
-        self.service = StreamingService()
-        
-        # Override fetch tracking
-        original_fetch = self.service.source.fetch_quotes
+        # Gap detection accede a q.ticker / q.timestamp sin comprobaciones por quote:
+        # verificar el contrato del modelo una sola vez
+        missing = {'ticker', 'timestamp'} - Quote.model_fields.keys()
+        if missing:
+            raise RuntimeError(f"Quote model missing fields required by gap detection: {missing}")
         
-        async def instrumented_fetch(ticker_list):
-            """Wrapper para medir latencia de cada fetch."""
-            fetch_start = time.time()
-            try:
-                quotes = await original_fetch(ticker_list)
-                latency_ms = (time.time() - fetch_start) * 1000
-                self.fetch_latencies_ms.append(latency_ms)
-                
-                if quotes:
-                    self.total_quotes += len(quotes)
-                    # Gap detection per ticker
-                    for q in quotes:
-                        if hasattr(q, 'symbol') and hasattr(q, 'timestamp'):
-                            self._detect_gap(q.symbol, q.timestamp)
-                
-                return quotes
-            except Exception as e:
-                self.total_errors += 1
-                logger.error(f"Error en fetch: {e}")
-                raise
-        
-        self.service.source.fetch_quotes = instrumented_fetch
-        
-        # Resource sampling task
-        async def resource_sampler():
-            """Sample resources cada 5 segundos."""
-            while True:
-                self._sample_resources()
-                await asyncio.sleep(5)
+        self.service = StreamingService()
         
-        # Start resource sampler
-        sampler_task = asyncio.create_task(resource_sampler())
+        # Fetch tracking vía hooks de la fuente (sin wrapper ni frame extra por fetch)
+        source = self.service.source
+        source.on_fetch_latency = self._on_fetch_latency
+        source.on_quotes = self._gap_queue.put_nowait  # gap detection diferida al _gap_worker
+        source.on_fetch_error = self._on_fetch_error
         
-        # Start streaming
-        streaming_task = asyncio.create_task(self.service.start())
+        # Start resource sampler (hilo daemon, no añade jitter al event loop)
+        self._sampler_stop.clear()
+        sampler_thread = threading.Thread(
+            target=self._sample_loop, name="resource-sampler", daemon=True
+        )
+        sampler_thread.start()
         
         try:
-            await asyncio.wait_for(streaming_task, timeout=duration_seconds)
-        except asyncio.TimeoutError:
+            try:
+                # Streaming + consumidor de gaps con cancelación estructurada
+                async with asyncio.timeout(duration_seconds), asyncio.TaskGroup() as tg:
+                    gap_task = tg.create_task(self._gap_worker())
+                    await tg.create_task(self.service.start())
+                    # El servicio terminó antes del timeout: liberar el TaskGroup
+                    gap_task.cancel()
+            except ExceptionGroup as eg:
+                # El TaskGroup agrupa los errores: propagar la excepción original
+                # a main() como antes, salvo que fallen varias tareas a la vez
+                if len(eg.exceptions) == 1:
+                    exc = eg.exceptions[0]
+                    raise exc from exc.__cause__
+                raise
+        except TimeoutError:
             logger.info("Tiempo de benchmark completado")
         except asyncio.CancelledError:
             logger.info("Benchmark cancelado")
         finally:
-            sampler_task.cancel()
-            try:
-                await sampler_task
-            except asyncio.CancelledError:
-                pass
+            self._sampler_stop.set()
+            sampler_thread.join()
+            self._drain_gap_queue()
             await self.service.stop()
         
         # Generate metrics
@@ -232,30 +362,39 @@ class BenchmarkRunner:
         end_time = datetime.now()
         duration = (end_time - self.start_time).total_seconds()
         
-        # Latency percentiles
-        latencies = list(self.fetch_latencies_ms)
-        if latencies:
-            latencies_sorted = sorted(latencies)
-            p50 = latencies_sorted[int(len(latencies_sorted) * 0.50)]
-            p95 = latencies_sorted[int(len(latencies_sorted) * 0.95)]
-            p99 = latencies_sorted[int(len(latencies_sorted) * 0.99)]
+        # Latency percentiles (estimación online, sin ordenar muestras; ns -> ms)
+        samples = self.total_latency_samples
+        p50 = self.latency_digest.percentile(50) / 1e6
+        p95 = self.latency_digest.percentile(95) / 1e6
+        p99 = self.latency_digest.percentile(99) / 1e6
+        
+        # Percentiles exactos sobre la ventana reciente (una llamada a NumPy)
+        window = self._lat_buf if self._lat_full else self._lat_buf[:self._lat_head]
+        if window.size:
+            w50, w95, w99 = (np.percentile(window, (50, 95, 99)) / 1e6).tolist()
         else:
-            p50 = p95 = p99 = 0.0
+            w50 = w95 = w99 = 0.0
         
         # Resource stats
-        memory_avg = statistics.mean(self.memory_samples) if self.memory_samples else 0.0
-        memory_max = max(self.memory_samples) if self.memory_samples else 0.0
-        cpu_avg = statistics.mean(self.cpu_samples) if self.cpu_samples else 0.0
-        cpu_max = max(self.cpu_samples) if self.cpu_samples else 0.0
+        n = self._n_samples
+        if n:
+            memory = self.memory_samples[:n]
+            cpu = self.cpu_samples[:n]
+            memory_avg, memory_max = float(memory.mean(dtype=np.float64)), float(memory.max())
+            cpu_avg, cpu_max = float(cpu.mean(dtype=np.float64)), float(cpu.max())
+        else:
+            memory_avg = memory_max = 0.0
+            cpu_avg = cpu_max = 0.0
         
         metrics = {
             "benchmark_id": "OPA-286",
             "timestamp": end_time.isoformat(),
             "configuration": {
-                "tickers_count": len(self._get_tickers()),
+                "tickers_count": len(self.tickers),
                 "duration_seconds": duration,
                 "duration_hours": duration / 3600,
-                "polling_interval": self.base_config['sources']['yahoo_finance'].get('fetch_interval', 60)
+                "polling_interval": self.base_config['sources']['yahoo_finance'].get('fetch_interval', 60),
+                "event_loop": type(asyncio.get_running_loop()).__module__.split('.')[0]
             },
             "throughput": {
                 "total_quotes": self.total_quotes,
@@ -267,7 +406,13 @@ class BenchmarkRunner:
                 "p50": round(p50, 2),
                 "p95": round(p95, 2),
                 "p99": round(p99, 2),
-                "samples": len(latencies)
+                "samples": samples,
+                "recent_window": {
+                    "p50": round(w50, 2),
+                    "p95": round(w95, 2),
+                    "p99": round(w99, 2),
+                    "samples": int(window.size)
+                }
             },
             "resources": {
                 "memory_avg_mb": round(memory_avg, 2),
@@ -284,16 +429,45 @@ class BenchmarkRunner:
         
         return metrics
     
-    def generate_report_markdown(self, metrics: Dict[str, Any], output_path: str) -> str:
+    def generate_report_markdown(
+        self,
+        metrics: Dict[str, Any],
+        output_path: str,
+        return_content: bool = False
+    ) -> Optional[str]:
         """
         Genera reporte en formato Markdown.
         
+        El reporte se escribe por secciones directamente al archivo, sin
+        construir el documento completo en memoria.
+        
         Args:
             metrics: Métricas del benchmark
             output_path: Ruta para guardar el reporte
+            return_content: Si True, devuelve también el contenido generado
             
         Returns:
-            Contenido del reporte
+            Contenido del reporte si return_content, si no None
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            self._write_report(metrics, f)
+        
+        logger.info(f"Reporte guardado en: {output_path}")
+        
+        if return_content:
+            buffer = io.StringIO()
+            self._write_report(metrics, buffer)
+            return buffer.getvalue()
+        return None
+    
+    def _write_report(self, metrics: Dict[str, Any], f: TextIO):
+        """
+        Escribe el reporte Markdown en un stream de texto.
+        
+        Args:
+            metrics: Métricas del benchmark
+            f: Stream de destino (archivo o StringIO)
         """
         tickers_count = metrics['configuration']['tickers_count']
         duration_hours = metrics['configuration']['duration_hours']
@@ -316,7 +490,7 @@ class BenchmarkRunner:
             recommendation = "🔶 **Evaluar optimizaciones Python primero**"
             recommendation_detail = "Hay margen de mejora antes de migrar a Rust."
         
-        report = f"""# Benchmark Streaming Python - 300 Tickers
+        f.write(f"""# Benchmark Streaming Python - 300 Tickers
 
 **Issue**: OPA-286
 **Fecha**: {metrics['timestamp']}
@@ -389,26 +563,77 @@ class BenchmarkRunner:
 ## 📎 Datos Crudos
 
 ```json
-{json.dumps(metrics, indent=2)}
+""")
+        json.dump(metrics, f, indent=2)
+        f.write("""
 ```
 
 ---
 
 *Generado automáticamente por `scripts/benchmark_streaming.py`*
-"""
-        
-        # Save report
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report)
-        
-        logger.info(f"Reporte guardado en: {output_path}")
-        return report
+""")
+    
+    
+# 300 tickers más líquidos del S&P 500 (OPA-285). Tupla inmutable compartida.
+_SP500_TOP300: Tuple[str, ...] = (
+    # Technology (50)
+    "AAPL", "MSFT", "GOOGL", "GOOG", "AMZN", "META", "NVDA", "TSLA", "AVGO", "ORCL",
+    "CSCO", "ADBE", "CRM", "INTC", "AMD", "QCOM", "TXN", "IBM", "INTU", "NOW",
+    "AMAT", "LRCX", "KLAC", "SNPS", "CDNS", "MU", "ADI", "MCHP", "FTNT", "PANW",
+    "NXPI", "MPWR", "KEYS", "ANSS", "SWKS", "CTSH", "IT", "HPQ", "HPE", "DELL",
+    "NTAP", "JNPR", "WDC", "STX", "FFIV", "AKAM", "ZBRA", "GEN", "EPAM", "ENPH",
+    
+    # Financials (45)
+    "JPM", "BAC", "WFC", "GS", "MS", "C", "BLK", "SCHW", "AXP", "SPGI",
+    "BX", "USB", "PNC", "TFC", "COF", "CME", "ICE", "MCO", "AIG", "MET",
+    "PRU", "AFL", "TRV", "CB", "ALL", "PGR", "HIG", "AJG", "MMC", "AON",
+    "MSCI", "FIS", "FISV", "GPN", "PYPL", "V", "MA", "AMP", "RJF", "NTRS",
+    "STT", "BK", "CFG", "RF", "FITB",
+    
+    # Healthcare (45)
+    "UNH", "JNJ", "LLY", "ABBV", "MRK", "TMO", "ABT", "PFE", "DHR", "BMY",
+    "AMGN", "GILD", "CVS", "CI", "ISRG", "VRTX", "REGN", "BIIB", "MRNA", "MDT",
+    "SYK", "BSX", "ZBH", "EW", "BDX", "DXCM", "IDXX", "IQV", "A", "MTD",
+    "WAT", "HOLX", "ALGN", "TECH", "RVTY", "CRL", "DGX", "LH", "HCA", "ELV",
+    "CNC", "MOH", "HUM", "MCK", "CAH",
+    
+    # Consumer Discretionary (35)
+    "HD", "MCD", "NKE", "SBUX", "LOW", "TJX", "BKNG", "GM", "F", "TGT",
+    "ROST", "CMG", "DHI", "LEN", "PHM", "NVR", "ORLY", "AZO", "BBY", "DRI",
+    "MAR", "HLT", "WYNN", "LVS", "MGM", "RCL", "CCL", "EXPE", "ABNB", "UBER",
+    "LYFT", "DPZ", "YUM", "QSR", "DARDEN",
+    
+    # Consumer Staples (25)
+    "WMT", "PG", "KO", "PEP", "COST", "PM", "MO", "CL", "EL", "KMB",
+    "MDLZ", "GIS", "K", "HSY", "CPB", "SJM", "CAG", "HRL", "TSN", "KHC",
+    "TAP", "STZ", "BF.B", "ADM", "BG",
+    
+    # Energy (25)
+    "XOM", "CVX", "COP", "SLB", "EOG", "PSX", "MPC", "VLO", "OXY", "PXD",
+    "DVN", "FANG", "HES", "HAL", "BKR", "KMI", "WMB", "OKE", "ET", "TRGP",
+    "LNG", "MRO", "APA", "CTRA", "EQT",
+    
+    # Industrials (40)
+    "BA", "CAT", "UNP", "HON", "UPS", "RTX", "LMT", "DE", "GE", "MMM",
+    "EMR", "ITW", "ETN", "PH", "ROK", "CMI", "PCAR", "FAST", "GWW", "SWK",
+    "IR", "DOV", "XYL", "NDSN", "IEX", "AME", "ROP", "TT", "CARR", "OTIS",
+    "TDG", "HWM", "TXT", "NOC", "GD", "LHX", "LDOS", "J", "FDX", "CSX",
+    
+    # Communication Services (15)
+    "DIS", "CMCSA", "NFLX", "T", "VZ", "TMUS", "CHTR", "EA", "TTWO", "WBD",
+    "FOXA", "FOX", "OMC", "IPG", "PARA",
+    
+    # Utilities (10)
+    "NEE", "DUK", "SO", "D", "AEP", "SRE", "EXC", "XEL", "ED", "PEG",
+    
+    # Real Estate (10)
+    "PLD", "AMT", "CCI", "EQIX", "PSA", "SPG", "O", "WELL", "DLR", "AVB",
+)
 
 
-def get_sp500_top300_tickers() -> List[str]:
+def get_sp500_top300_tickers() -> Tuple[str, ...]:
     """
-    Retorna lista de 300 tickers más líquidos del S&P 500.
+    Retorna los 300 tickers más líquidos del S&P 500.
     
     Basado en:
     - Capitalización de mercado
@@ -418,60 +643,7 @@ def get_sp500_top300_tickers() -> List[str]:
     Nota: Esta lista está hardcodeada basándose en OPA-285.
     En futuras versiones, se cargará desde archivo externo.
     """
-    return [
-        # Technology (50)
-        "AAPL", "MSFT", "GOOGL", "GOOG", "AMZN", "META", "NVDA", "TSLA", "AVGO", "ORCL",
-        "CSCO", "ADBE", "CRM", "INTC", "AMD", "QCOM", "TXN", "IBM", "INTU", "NOW",
-        "AMAT", "LRCX", "KLAC", "SNPS", "CDNS", "MU", "ADI", "MCHP", "FTNT", "PANW",
-        "NXPI", "MPWR", "KEYS", "ANSS", "SWKS", "CTSH", "IT", "HPQ", "HPE", "DELL",
-        "NTAP", "JNPR", "WDC", "STX", "FFIV", "AKAM", "ZBRA", "GEN", "EPAM", "ENPH",
-        
-        # Financials (45)
-        "JPM", "BAC", "WFC", "GS", "MS", "C", "BLK", "SCHW", "AXP", "SPGI",
-        "BX", "USB", "PNC", "TFC", "COF", "CME", "ICE", "MCO", "AIG", "MET",
-        "PRU", "AFL", "TRV", "CB", "ALL", "PGR", "HIG", "AJG", "MMC", "AON",
-        "MSCI", "FIS", "FISV", "GPN", "PYPL", "V", "MA", "AMP", "RJF", "NTRS",
-        "STT", "BK", "CFG", "RF", "FITB",
-        
-        # Healthcare (45)
-        "UNH", "JNJ", "LLY", "ABBV", "MRK", "TMO", "ABT", "PFE", "DHR", "BMY",
-        "AMGN", "GILD", "CVS", "CI", "ISRG", "VRTX", "REGN", "BIIB", "MRNA", "MDT",
-        "SYK", "BSX", "ZBH", "EW", "BDX", "DXCM", "IDXX", "IQV", "A", "MTD",
-        "WAT", "HOLX", "ALGN", "TECH", "RVTY", "CRL", "DGX", "LH", "HCA", "ELV",
-        "CNC", "MOH", "HUM", "MCK", "CAH",
-        
-        # Consumer Discretionary (35)
-        "HD", "MCD", "NKE", "SBUX", "LOW", "TJX", "BKNG", "GM", "F", "TGT",
-        "ROST", "CMG", "DHI", "LEN", "PHM", "NVR", "ORLY", "AZO", "BBY", "DRI",
-        "MAR", "HLT", "WYNN", "LVS", "MGM", "RCL", "CCL", "EXPE", "ABNB", "UBER",
-        "LYFT", "DPZ", "YUM", "QSR", "DARDEN",
-        
-        # Consumer Staples (25)
-        "WMT", "PG", "KO", "PEP", "COST", "PM", "MO", "CL", "EL", "KMB",
-        "MDLZ", "GIS", "K", "HSY", "CPB", "SJM", "CAG", "HRL", "TSN", "KHC",
-        "TAP", "STZ", "BF.B", "ADM", "BG",
-        
-        # Energy (25)
-        "XOM", "CVX", "COP", "SLB", "EOG", "PSX", "MPC", "VLO", "OXY", "PXD",
-        "DVN", "FANG", "HES", "HAL", "BKR", "KMI", "WMB", "OKE", "ET", "TRGP",
-        "LNG", "MRO", "APA", "CTRA", "EQT",
-        
-        # Industrials (40)
-        "BA", "CAT", "UNP", "HON", "UPS", "RTX", "LMT", "DE", "GE", "MMM",
-        "EMR", "ITW", "ETN", "PH", "ROK", "CMI", "PCAR", "FAST", "GWW", "SWK",
-        "IR", "DOV", "XYL", "NDSN", "IEX", "AME", "ROP", "TT", "CARR", "OTIS",
-        "TDG", "HWM", "TXT", "NOC", "GD", "LHX", "LDOS", "J", "FDX", "CSX",
-        
-        # Communication Services (15)
-        "DIS", "CMCSA", "NFLX", "T", "VZ", "TMUS", "CHTR", "EA", "TTWO", "WBD",
-        "FOXA", "FOX", "OMC", "IPG", "PARA",
-        
-        # Utilities (10)
-        "NEE", "DUK", "SO", "D", "AEP", "SRE", "EXC", "XEL", "ED", "PEG",
-        
-        # Real Estate (10)
-        "PLD", "AMT", "CCI", "EQIX", "PSA", "SPG", "O", "WELL", "DLR", "AVB",
-    ]
+    return _SP500_TOP300
 
 
 async def main():
@@ -544,7 +716,7 @@ async def main():
         logger.info(f"Métricas guardadas: {output_path}")
         
         # Generate markdown report
-        report = runner.generate_report_markdown(metrics, args.report)
+        runner.generate_report_markdown(metrics, args.report)
         
         # Print summary
         print("\n" + "="*60)
@@ -569,5 +741,18 @@ async def main():
         sys.exit(1)
 
 
+def _event_loop_factory():
+    """Devuelve el factory de uvloop si está instalado (extra `speedups`).
+    
+    Nota: el benchmark y producción deben usar el mismo event loop; si no,
+    las latencias del reporte no son comparables con las de producción.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=_event_loop_factory())
@@ -5,36 +5,45 @@ import asyncio
 import logging
 import signal
 import time
-from typing import List
+from typing import List, Optional
 
-from opa_quotes_streamer.config import get_settings
+from opa_quotes_streamer.config import Settings, get_settings
 from opa_quotes_streamer.logging_setup import setup_logging
-from opa_quotes_streamer.sources.yfinance_source import YFinanceSource
-from opa_quotes_streamer.publishers.storage_publisher import StoragePublisher, PublisherError
-from opa_quotes_streamer.publishers.redis_publisher import RedisPublisher
-from opa_quotes_streamer.metrics import StreamingMetrics
-from opa_shared_utils.utils.pipeline_logger import PipelineLogger
-from sqlalchemy.exc import OperationalError
 
-setup_logging()
-logger = logging.getLogger(__name__)
+# Heavy dependencies (yfinance/pandas, httpx, redis, prometheus, sqlalchemy)
+# are imported where they are used so importing this module stays cheap
 
-settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 class StreamingService:
     """Real-time streaming service with polling loop."""
     
-    def __init__(self):
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialize service components.
+        
+        Args:
+            settings: Application settings (defaults to get_settings())
+        """
+        from opa_quotes_streamer.metrics import StreamingMetrics
+        from opa_quotes_streamer.publishers.redis_publisher import RedisPublisher
+        from opa_quotes_streamer.publishers.storage_publisher import StoragePublisher
+        from opa_quotes_streamer.sources.yfinance_source import YFinanceSource
+        from opa_shared_utils.utils.pipeline_logger import PipelineLogger
+        
+        self.settings = settings or get_settings()
+        settings = self.settings
         self.pipeline_logger = PipelineLogger(
             repository="opa-quotes-streamer",
             pipeline_name="quotes-streaming",
             db_url=settings.database_url
         )
         self.running = False
+        # Set to wake the stream loop immediately on shutdown
+        self._stop_event = asyncio.Event()
         
         # Parse tickers from settings
-        self.tickers = [t.strip() for t in settings.tickers.split(",")]
+        self.tickers = settings.tickers_list
         logger.info(f"Configured tickers: {self.tickers}")
         
         # Initialize components
@@ -45,11 +54,13 @@ class StreamingService:
             storage_url=settings.storage_api_url,
             timeout=settings.storage_timeout,
             circuit_breaker_threshold=settings.circuit_breaker_threshold,
-            circuit_breaker_timeout=settings.circuit_breaker_timeout
+            circuit_breaker_timeout=settings.circuit_breaker_timeout,
+            content_encoding=settings.storage_content_encoding
         )
         self.redis_publisher = RedisPublisher(
             redis_url=settings.redis_url,
-            channel=settings.redis_channel
+            channel=settings.redis_channel,
+            batch_mode=settings.redis_batch_mode
         )
         self.metrics = StreamingMetrics()
         
@@ -60,6 +71,9 @@ class StreamingService:
     
     async def start(self):
         """Start streaming service."""
+        from sqlalchemy.exc import OperationalError
+        
+        settings = self.settings
         try:
             self.pipeline_logger.start(triggered_by="streamer-init")
         except (OperationalError, UnicodeDecodeError) as e:
@@ -72,7 +86,7 @@ class StreamingService:
         
         # Start metrics server
         self.metrics.start_metrics_server(port=settings.metrics_port)
-        self.metrics.set_active_tickers(len(settings.tickers.split(",")))
+        self.metrics.set_active_tickers(len(settings.tickers_list))
         
         self.running = True
         
@@ -92,80 +106,111 @@ class StreamingService:
     
     async def stream_loop(self):
         """Main streaming loop with fetch + publish cycle."""
+        from opa_quotes_streamer.publishers.storage_publisher import PublisherError
+        from sqlalchemy.exc import OperationalError
+        
         logger.info("Entering streaming loop...")
         
+        # Settings are immutable: read hot-path values once
+        settings = self.settings
+        redis_publisher_enabled = settings.redis_publisher_enabled
+        publisher_enabled = settings.publisher_enabled
+        polling_interval = settings.polling_interval
+        
+        # Bind per-cycle callables once (components don't change while running)
+        perf_counter = time.perf_counter
+        tickers = self.tickers
+        fetch_quotes = self.source.fetch_quotes
+        redis_publish_batch = self.redis_publisher.publish_batch
+        publish_batch = self.publisher.publish_batch
+        metrics = self.metrics
+        record_fetch = metrics.record_fetch
+        record_publish = metrics.record_publish
+        set_circuit_breaker_state = metrics.set_circuit_breaker_state
+        observe_loop = metrics.loop_duration_seconds.observe
+        
+        # Cycles start on a fixed cadence (next_tick), not interval after work ends
+        next_tick = perf_counter()
+        
         while self.running:
-            cycle_start = time.time()
+            # Monotonic timestamps: each step starts where the previous one ended
+            cycle_start = perf_counter()
             
             try:
                 # Fetch quotes
-                fetch_start = time.time()
-                quotes = await self.source.fetch_quotes(self.tickers)
-                fetch_duration = time.time() - fetch_start
+                quotes = await fetch_quotes(tickers)
+                mark = perf_counter()
+                fetch_duration = mark - cycle_start
                 
                 if quotes:
-                    self.total_quotes_fetched += len(quotes)
-                    self.metrics.record_fetch(len(quotes), fetch_duration)
-                    logger.info(f"Fetched {len(quotes)} quotes in {fetch_duration:.2f}s")
+                    n_quotes = len(quotes)
+                    self.total_quotes_fetched += n_quotes
+                    record_fetch(n_quotes, fetch_duration)
+                    logger.info("Fetched %d quotes in %.2fs", n_quotes, fetch_duration)
                     
                     # Publish to Redis (if enabled)
-                    if settings.redis_publisher_enabled:
-                        redis_start = time.time()
+                    if redis_publisher_enabled:
                         try:
-                            redis_published = await self.redis_publisher.publish_batch(quotes)
-                            redis_duration = time.time() - redis_start
-                            logger.info(f"Published {redis_published} quotes to Redis in {redis_duration:.2f}s")
+                            redis_published = await redis_publish_batch(quotes)
+                            now = perf_counter()
+                            redis_duration, mark = now - mark, now
+                            logger.info("Published %d quotes to Redis in %.2fs", redis_published, redis_duration)
                             
                             # Update circuit breaker state metric
                             redis_cb_state = self.redis_publisher._circuit_breaker.state
-                            self.metrics.set_circuit_breaker_state("redis", redis_cb_state.value)
+                            set_circuit_breaker_state("redis", redis_cb_state.value)
                         except Exception as e:
                             logger.warning(f"Redis publisher error: {e}")
-                            self.metrics.record_error("redis_publish")
+                            metrics.record_error("redis_publish")
+                            mark = perf_counter()
                             redis_cb_state = self.redis_publisher._circuit_breaker.state
-                            self.metrics.set_circuit_breaker_state("redis", redis_cb_state.value)
+                            set_circuit_breaker_state("redis", redis_cb_state.value)
                     
                     # Publish to storage (if enabled)
-                    if settings.publisher_enabled:
-                        publish_start = time.time()
+                    if publisher_enabled:
                         try:
-                            inserted = await self.publisher.publish_batch(quotes)
-                            publish_duration = time.time() - publish_start
+                            inserted = await publish_batch(quotes)
+                            publish_duration = perf_counter() - mark
                             
                             self.total_quotes_published += inserted
-                            self.metrics.record_publish(inserted, publish_duration)
-                            logger.info(f"Published {inserted} quotes in {publish_duration:.2f}s")
+                            record_publish(inserted, publish_duration)
+                            logger.info("Published %d quotes in %.2fs", inserted, publish_duration)
                             
                             # Update circuit breaker state metric
                             cb_state = self.publisher.get_circuit_state()
-                            self.metrics.set_circuit_breaker_state("storage", cb_state)
+                            set_circuit_breaker_state("storage", cb_state)
                             
                         except PublisherError as e:
                             logger.warning(f"Publisher error: {e}")
-                            self.metrics.record_error("publish")
+                            metrics.record_error("publish")
                             
                             # Update circuit breaker state even on error
                             cb_state = self.publisher.get_circuit_state()
-                            self.metrics.set_circuit_breaker_state("storage", cb_state)
+                            set_circuit_breaker_state("storage", cb_state)
                     else:
                         logger.debug("Publisher disabled, skipping publish")
                 else:
                     logger.debug("No quotes fetched this cycle")
                 
                 # Record full cycle duration
-                cycle_duration = time.time() - cycle_start
-                self.metrics.loop_duration_seconds.observe(cycle_duration)
+                cycle_end = perf_counter()
+                cycle_duration = cycle_end - cycle_start
+                observe_loop(cycle_duration)
                 self.cycle_count += 1
                 
                 # Log cycle summary
                 logger.info(
-                    f"Cycle {self.cycle_count} completed in {cycle_duration:.2f}s "
-                    f"(total fetched: {self.total_quotes_fetched}, "
-                    f"total published: {self.total_quotes_published})"
+                    "Cycle %d completed in %.2fs (total fetched: %d, total published: %d)",
+                    self.cycle_count,
+                    cycle_duration,
+                    self.total_quotes_fetched,
+                    self.total_quotes_published
                 )
                 
-                # Polling interval sleep
-                await asyncio.sleep(settings.polling_interval)
+                # Sleep until the next tick (returns early on shutdown); if the
+                # cycle overran, skip missed ticks instead of running back-to-back
+                next_tick = max(next_tick + polling_interval, cycle_end)
+                await self._wait_for_stop(next_tick - cycle_end)
                 
             except asyncio.CancelledError:
                 logger.info("Stream cancelled, shutting down...")
@@ -173,7 +218,8 @@ class StreamingService:
             except Exception as e:
                 logger.error(f"Error in stream loop: {e}", exc_info=True)
                 self.metrics.record_error("stream_loop")
-                await asyncio.sleep(5)  # Backoff on error
+                await self._wait_for_stop(5)  # Backoff on error
+                next_tick = perf_counter()
         
         # Finalize
         try:
@@ -190,12 +236,29 @@ class StreamingService:
         
         logger.info(f"Stream loop exited after {self.cycle_count} cycles")
     
+    async def _wait_for_stop(self, timeout: float) -> None:
+        """Sleep up to timeout seconds, returning early if a stop is requested.
+        
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+    
+    def request_stop(self) -> None:
+        """Ask the stream loop to exit (safe to call from a signal handler)."""
+        self.running = False
+        self._stop_event.set()
+    
     async def stop(self):
         """Stop streaming service gracefully."""
         logger.info("Stopping streaming service...")
-        self.running = False
+        self.request_stop()
         
-        # Close publisher connections
+        # Close source and publisher connections
+        await self.source.close()
         await self.publisher.close()
         await self.redis_publisher.close()
         
@@ -204,17 +267,14 @@ class StreamingService:
 
 async def main():
     """Main entry point with graceful shutdown."""
-    service = StreamingService()
-    
-    # Setup signal handlers
-    loop = asyncio.get_event_loop()
-    
-    def signal_handler(sig):
-        logger.info(f"Received signal {sig}, initiating shutdown...")
-        asyncio.create_task(service.stop())
+    setup_logging()
+    settings = get_settings()
+    service = StreamingService(settings)
     
+    # Setup signal handlers: wake the stream loop, cleanup runs in finally
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
+        loop.add_signal_handler(sig, service.request_stop)
     
     try:
         await service.start()
@@ -224,5 +284,14 @@ async def main():
         await service.stop()
 
 
+def _event_loop_factory():
+    """Return uvloop's loop factory if installed (`speedups` extra), else None."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=_event_loop_factory())
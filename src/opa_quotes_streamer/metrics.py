@@ -5,6 +5,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Label values emitted by the streaming service; their children are bound at init
+_ERROR_TYPES = ("fetch", "publish", "redis_publish", "stream_loop", "critical", "network")
+_PUBLISHERS = ("storage", "redis")
+
+# Gauge encoding of CircuitState values (callers pass the enum's lowercase value)
+_CB_STATES = {"closed": 0, "open": 1, "half_open": 2}
+
 
 class StreamingMetrics:
     """Prometheus metrics collector for streaming service."""
@@ -59,6 +66,14 @@ class StreamingMetrics:
             ['publisher']
         )
         
+        # Pre-resolved label children (skip .labels() lookup on each update)
+        self._error_children = {
+            k: self.errors_total.labels(error_type=k) for k in _ERROR_TYPES
+        }
+        self._cb_children = {
+            k: self.circuit_breaker_state.labels(publisher=k) for k in _PUBLISHERS
+        }
+        
         logger.info("Prometheus metrics initialized")
     
     def start_metrics_server(self, port: int = 8001):
@@ -99,7 +114,10 @@ class StreamingMetrics:
         Args:
             error_type: Type of error (e.g., 'fetch', 'publish', 'network')
         """
-        self.errors_total.labels(error_type=error_type).inc()
+        child = self._error_children.get(error_type)
+        if child is None:
+            child = self._error_children[error_type] = self.errors_total.labels(error_type=error_type)
+        child.inc()
     
     def set_active_tickers(self, count: int):
         """Update the number of active tickers.
@@ -116,11 +134,7 @@ class StreamingMetrics:
             publisher: Name of the publisher
             state: Current state ('closed', 'open', 'half_open')
         """
-        state_map = {
-            'closed': 0,
-            'open': 1,
-            'half_open': 2
-        }
-        self.circuit_breaker_state.labels(publisher=publisher).set(
-            state_map.get(state.lower(), 0)
-        )
+        child = self._cb_children.get(publisher)
+        if child is None:
+            child = self._cb_children[publisher] = self.circuit_breaker_state.labels(publisher=publisher)
+        child.set(_CB_STATES.get(state, 0))
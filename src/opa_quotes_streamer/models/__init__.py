@@ -1,5 +1,5 @@
 """Data models for opa-quotes-streamer."""
 
-from .quote import Quote
+from .quote import Quote, QuoteListAdapter
 
-__all__ = ["Quote"]
+__all__ = ["Quote", "QuoteListAdapter"]
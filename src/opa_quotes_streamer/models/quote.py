@@ -1,9 +1,11 @@
 """Quote data model."""
 
-import re
 from datetime import datetime, timezone
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, ConfigDict
+
+# Contract invariants, built once at import
+_VALID_SOURCES = frozenset({"yfinance", "fmp", "manual"})  # INV-005
 
 
 class Quote(BaseModel):
@@ -67,8 +69,9 @@ class Quote(BaseModel):
         
         Contract invariant INV-002: Ticker must match ^[A-Z]{1,5}$
         """
-        v = v.upper().strip()
-        if not re.match(r'^[A-Z]{1,5}$', v):
+        v = v.upper()
+        # Equivalent to ^[A-Z]{1,5}$ after upper(), using C-level str checks
+        if not (1 <= len(v) <= 5 and v.isascii() and v.isalpha()):
             raise ValueError(
                 f"Invalid ticker format: {v}. Must match ^[A-Z]{{1,5}}$ (INV-002)"
             )
@@ -98,15 +101,17 @@ class Quote(BaseModel):
         
         Contract invariant INV-005: Source must be 'yfinance', 'fmp', or 'manual'.
         """
-        v = v.lower().strip()
-        valid_sources = ["yfinance", "fmp", "manual"]
-        if v not in valid_sources:
+        v = v.lower()
+        if v not in _VALID_SOURCES:
             raise ValueError(
-                f"Invalid source: {v}. Must be one of {valid_sources} (INV-005)"
+                f"Invalid source: {v}. Must be one of {sorted(_VALID_SOURCES)} (INV-005)"
             )
         return v
     
     model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        str_strip_whitespace=True,  # stripped in pydantic-core before validators run
         json_schema_extra={
             "example": {
                 "ticker": "AAPL",
@@ -123,3 +128,7 @@ class Quote(BaseModel):
             }
         }
     )
+
+
+# Validates a whole batch of quote dicts in a single pydantic-core call
+QuoteListAdapter: TypeAdapter[list[Quote]] = TypeAdapter(list[Quote])
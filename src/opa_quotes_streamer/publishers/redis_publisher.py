@@ -1,13 +1,15 @@
 """Redis Pub/Sub publisher for real-time quotes."""
 
-import json
+import asyncio
+import itertools
 import logging
+import secrets
 from datetime import datetime, timezone
-from typing import List, Optional
-from uuid import uuid4
+from typing import Dict, List, Optional
 
 import redis.asyncio as redis
 from prometheus_client import Counter, Histogram
+from pydantic_core import to_json
 
 from opa_quotes_streamer.models.quote import Quote
 from opa_quotes_streamer.publishers.base import BasePublisher
@@ -29,13 +31,40 @@ REDIS_PUBLISH_ERRORS_TOTAL = Counter(
 
 REDIS_PUBLISH_LATENCY_SECONDS = Histogram(
     'redis_publish_latency_seconds',
-    'Redis publish operation latency in seconds',
+    'Redis publish latency per batch (one pipeline round-trip) in seconds',
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0]
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Constant CloudEvents envelope, pre-serialized; only id, time and data vary
+_EVENT_PREFIX = (
+    b'{"specversion":"1.0",'
+    b'"type":"com.opamachine.quotes.price-updated",'
+    b'"source":"opa-quotes-streamer",'
+    b'"id":"'
+)
+_EVENT_TIME = b'","time":"'
+_EVENT_DATA = b'","datacontenttype":"application/json","data":'
+_EVENT_SUFFIX = b'}'
+
+# Event ids: random per-process prefix + counter (unique per source, no urandom per event)
+_EVENT_ID_PREFIX = secrets.token_hex(8)
+_event_counter = itertools.count()
+
+# Clients shared by all publishers of this process, keyed by Redis URL, so
+# several publishers on one server reuse a single client and connection pool.
+# _CLIENT_REFS counts the publishers holding each client; the last one to
+# close it closes the pool.
+_CLIENT_CACHE: Dict[str, redis.Redis] = {}
+_CLIENT_REFS: Dict[str, int] = {}
+
+
+def _next_event_id() -> str:
+    """Return a new CloudEvents id, unique within this process's event source."""
+    return f"{_EVENT_ID_PREFIX}-{next(_event_counter)}"
+
 
 class RedisPublisher(BasePublisher):
     """Publisher for streaming quotes to Redis Pub/Sub.
@@ -48,8 +77,8 @@ class RedisPublisher(BasePublisher):
             "specversion": "1.0",
             "type": "com.opamachine.quotes.price-updated",
             "source": "opa-quotes-streamer",
-            "id": "uuid",
-            "time": "ISO 8601",
+            "id": "<process-prefix>-<seq>",
+            "time": "RFC 3339 (UTC, Z)",
             "datacontenttype": "application/json",
             "data": {
                 "ticker": "AAPL",
@@ -62,6 +91,8 @@ class RedisPublisher(BasePublisher):
         redis_url: Redis connection URL (default: redis://localhost:6381)
         channel: Redis channel name (default: quotes.realtime)
         circuit_breaker: Circuit breaker for Redis operations
+        batch_mode: Whether batches are sent as a single CloudEvents JSON batch
+        health_check_interval: Seconds between background pings (0 disables)
     
     Example:
         >>> publisher = RedisPublisher("redis://localhost:6381")
@@ -73,7 +104,9 @@ class RedisPublisher(BasePublisher):
         self,
         redis_url: str = "redis://localhost:6381",
         channel: str = "quotes.realtime",
-        circuit_breaker: Optional[CircuitBreaker] = None
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        batch_mode: bool = False,
+        health_check_interval: float = 10.0
     ):
         """Initialize Redis publisher.
         
@@ -81,19 +114,34 @@ class RedisPublisher(BasePublisher):
             redis_url: Redis connection URL
             channel: Redis channel to publish to
             circuit_breaker: Optional circuit breaker instance
+            batch_mode: Publish each batch as one CloudEvents JSON batch
+                message (array of events) instead of one message per quote
+            health_check_interval: Seconds between background liveness pings;
+                failed pings count against the circuit breaker (0 disables)
         """
         self.redis_url = redis_url
         self.channel = channel
+        self._channel_bytes = channel.encode()
+        self.batch_mode = batch_mode
+        self.health_check_interval = health_check_interval
         self._client: Optional[redis.Redis] = None
+        self._health_task: Optional[asyncio.Task] = None
         self._circuit_breaker = circuit_breaker or CircuitBreaker(
             failure_threshold=5,
             timeout=30.0
         )
-        logger.info(f"RedisPublisher initialized: url={redis_url}, channel={channel}")
+        logger.info(
+            f"RedisPublisher initialized: url={redis_url}, channel={channel}, "
+            f"batch_mode={batch_mode}"
+        )
     
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client.
         
+        The client is shared with other publishers using the same URL. No
+        ping is sent here; liveness is checked by a background task started
+        with the client, so the first publish does not pay an extra RTT.
+        
         Returns:
             Redis client instance
             
@@ -101,54 +149,64 @@ class RedisPublisher(BasePublisher):
             redis.RedisError: If connection fails
         """
         if self._client is None:
+            client = _CLIENT_CACHE.get(self.redis_url)
+            if client is None:
+                try:
+                    # Binary client: payloads are already bytes and replies are
+                    # never read as text, so skip redis-py's encode/decode
+                    client = await redis.from_url(self.redis_url)
+                    logger.info("Redis client created")
+                except Exception as e:
+                    logger.error(f"Failed to connect to Redis: {e}")
+                    raise
+                _CLIENT_CACHE[self.redis_url] = client
+            _CLIENT_REFS[self.redis_url] = _CLIENT_REFS.get(self.redis_url, 0) + 1
+            self._client = client
+            if self._health_task is None and self.health_check_interval > 0:
+                self._health_task = asyncio.create_task(self._health_loop())
+        return self._client
+    
+    async def _health_loop(self) -> None:
+        """Ping Redis periodically; failed pings count as breaker failures."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
             try:
-                self._client = await redis.from_url(
-                    self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True
-                )
                 await self._client.ping()
-                logger.info("Redis connection established")
             except Exception as e:
-                logger.error(f"Failed to connect to Redis: {e}")
-                raise
-        return self._client
+                logger.warning(f"Redis health check failed: {e}")
+                self._circuit_breaker.record_failure(e)
     
-    def _quote_to_cloudevent(self, quote: Quote) -> dict:
-        """Convert Quote to CloudEvents 1.0 format.
+    def _encode_cloudevent(self, quote: Quote, time_iso: bytes) -> bytes:
+        """Encode Quote as a CloudEvents 1.0 JSON message.
+        
+        No envelope dict is built: the constant parts are pre-serialized and
+        the data payload is the Quote serialized by pydantic-core.
         
         Args:
-            quote: Quote object to convert
+            quote: Quote object to encode
+            time_iso: Event time (RFC 3339, UTF-8 bytes), in the same "Z"
+                form pydantic-core uses for data.timestamp
             
         Returns:
-            CloudEvents formatted dictionary
+            JSON message as bytes
         """
-        return {
-            "specversion": "1.0",
-            "type": "com.opamachine.quotes.price-updated",
-            "source": "opa-quotes-streamer",
-            "id": str(uuid4()),
-            "time": datetime.now(timezone.utc).isoformat(),
-            "datacontenttype": "application/json",
-            "data": {
-                "ticker": quote.ticker,
-                "price": quote.price,
-                "volume": quote.volume,
-                "timestamp": quote.timestamp.isoformat(),
-                "source": quote.source,
-                "bid": quote.bid,
-                "ask": quote.ask,
-                "open": quote.open,
-                "high": quote.high,
-                "low": quote.low,
-                "previous_close": quote.previous_close
-            }
-        }
+        return b''.join((
+            _EVENT_PREFIX,
+            _next_event_id().encode(),
+            _EVENT_TIME,
+            time_iso,
+            _EVENT_DATA,
+            to_json(quote),
+            _EVENT_SUFFIX
+        ))
     
     async def publish_batch(self, quotes: List[Quote]) -> int:
         """Publish a batch of quotes to Redis.
         
-        Wraps each quote in CloudEvents format and publishes to Redis channel.
+        Wraps each quote in CloudEvents format and sends all PUBLISH commands
+        in a single non-transactional pipeline (one round-trip per batch).
+        In batch mode the events are sent as one CloudEvents JSON batch
+        message instead, which either succeeds or fails as a whole.
         Uses circuit breaker to prevent cascading failures.
         
         Args:
@@ -163,45 +221,87 @@ class RedisPublisher(BasePublisher):
         if not quotes:
             return 0
         
-        published_count = 0
+        # Convert to CloudEvents format (one event time per batch, serialized
+        # like data.timestamp so a message never mixes "Z" and "+00:00")
+        time_iso = to_json(datetime.now(timezone.utc))[1:-1]
+        events = [self._encode_cloudevent(quote, time_iso) for quote in quotes]
         
-        for quote in quotes:
-            try:
-                with REDIS_PUBLISH_LATENCY_SECONDS.time():
-                    # Convert to CloudEvents format
-                    event = self._quote_to_cloudevent(quote)
-                    event_json = json.dumps(event)
-                    
-                    # Publish with circuit breaker
-                    async def publish():
-                        client = await self._get_client()
-                        await client.publish(self.channel, event_json)
-                    
-                    await self._circuit_breaker.call(publish)
-                    
-                published_count += 1
-                REDIS_PUBLISHES_TOTAL.labels(status="success").inc()
+        # Publish with circuit breaker (whole pipeline is one call)
+        try:
+            with REDIS_PUBLISH_LATENCY_SECONDS.time():
+                results = await self._circuit_breaker.call(self._publish_events, events)
                 
-            except redis.RedisError as e:
-                logger.error(f"Redis error publishing quote {quote.ticker}: {e}")
+        except redis.RedisError as e:
+            logger.error(f"Redis error publishing batch of {len(quotes)} quotes: {e}")
+            REDIS_PUBLISH_ERRORS_TOTAL.labels(error_type="redis_error").inc()
+            REDIS_PUBLISHES_TOTAL.labels(status="error").inc(len(quotes))
+            return 0
+            
+        except Exception as e:
+            logger.error(f"Unexpected error publishing batch of {len(quotes)} quotes: {e}")
+            REDIS_PUBLISH_ERRORS_TOTAL.labels(error_type="unknown").inc()
+            REDIS_PUBLISHES_TOTAL.labels(status="error").inc(len(quotes))
+            return 0
+        
+        if self.batch_mode:
+            results = ()
+            published_count = len(quotes)
+        else:
+            published_count = 0
+        
+        # Per-command results: subscriber count, or the exception for that PUBLISH
+        for quote, result in zip(quotes, results):
+            if isinstance(result, Exception):
+                logger.error(f"Redis error publishing quote {quote.ticker}: {result}")
                 REDIS_PUBLISH_ERRORS_TOTAL.labels(error_type="redis_error").inc()
                 REDIS_PUBLISHES_TOTAL.labels(status="error").inc()
-                # Continue with next quote (at-least-once delivery)
-                
-            except Exception as e:
-                logger.error(f"Unexpected error publishing quote {quote.ticker}: {e}")
-                REDIS_PUBLISH_ERRORS_TOTAL.labels(error_type="unknown").inc()
-                REDIS_PUBLISHES_TOTAL.labels(status="error").inc()
+            else:
+                published_count += 1
+        
+        if published_count:
+            REDIS_PUBLISHES_TOTAL.labels(status="success").inc(published_count)
         
         logger.info(f"Published {published_count}/{len(quotes)} quotes to Redis")
         return published_count
     
+    async def _publish_events(self, events: List[bytes]) -> Optional[list]:
+        """Send encoded events to the channel in one round-trip.
+        
+        Args:
+            events: Encoded CloudEvents
+            
+        Returns:
+            Per-command pipeline results (subscriber count or exception),
+            or None in batch mode
+        """
+        client = await self._get_client()
+        if self.batch_mode:
+            # CloudEvents JSON batch format: one message, array of events
+            await client.publish(self._channel_bytes, b"[" + b",".join(events) + b"]")
+            return None
+        pipe = client.pipeline(transaction=False)
+        for event_json in events:
+            pipe.publish(self._channel_bytes, event_json)
+        return await pipe.execute(raise_on_error=False)
+    
     async def close(self) -> None:
         """Close Redis connection.
         
-        Should be called on shutdown to cleanly close the connection.
+        Should be called on shutdown to cleanly close the connection. The
+        shared client is only closed when the last publisher using it
+        closes, so in-flight commands of other publishers are not dropped.
         """
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
         if self._client:
-            await self._client.close()
-            self._client = None
+            client, self._client = self._client, None
+            if _CLIENT_CACHE.get(self.redis_url) is client:
+                refs = _CLIENT_REFS.get(self.redis_url, 1) - 1
+                if refs > 0:
+                    _CLIENT_REFS[self.redis_url] = refs
+                    return
+                del _CLIENT_CACHE[self.redis_url]
+                _CLIENT_REFS.pop(self.redis_url, None)
+            await client.aclose()
             logger.info("Redis connection closed")
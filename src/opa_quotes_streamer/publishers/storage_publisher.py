@@ -1,8 +1,15 @@
 """Storage publisher for sending quotes to opa-quotes-storage."""
 
 import logging
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Literal, Optional
 import httpx
+from pydantic_core import to_json
+
+try:
+    import msgspec
+except ImportError:  # optional: `speedups` extra
+    msgspec = None
 
 from opa_quotes_streamer.models.quote import Quote
 from opa_quotes_streamer.publishers.base import BasePublisher
@@ -11,6 +18,38 @@ from opa_quotes_streamer.utils.circuit_breaker import CircuitBreaker, CircuitBre
 logger = logging.getLogger(__name__)
 
 
+if msgspec is not None:
+    class StorageQuoteWire(msgspec.Struct, frozen=True):
+        """Wire format of one quote in the opa-quotes-api batch payload.
+        
+        Field order and names match _WIRE_FIELDS, the dict form sent
+        without msgspec (price is sent as close).
+        """
+        ticker: str
+        timestamp: datetime
+        close: float
+        open: Optional[float]
+        high: Optional[float]
+        low: Optional[float]
+        volume: int
+        source: str
+    
+    _encode_json = msgspec.json.Encoder().encode
+    _encode_msgpack = msgspec.msgpack.Encoder().encode
+else:
+    StorageQuoteWire = None
+
+# Field names of one quote in the batch payload, in wire order
+_WIRE_FIELDS = ("ticker", "timestamp", "close", "open", "high", "low", "volume", "source")
+
+ContentEncoding = Literal["json", "msgpack"]
+
+_CONTENT_TYPES: Dict[str, str] = {
+    "json": "application/json",
+    "msgpack": "application/x-msgpack",
+}
+
+
 class PublisherError(Exception):
     """Exception raised for publisher-specific errors."""
     pass
@@ -22,12 +61,14 @@ class StoragePublisher(BasePublisher):
     Sends batches of quotes to the storage service with:
     - Circuit breaker pattern for fault tolerance
     - Configurable timeout
+    - Persistent HTTP client with keep-alive connection pool
     - Automatic retry handling via circuit breaker
     - Detailed logging
     
     Attributes:
         storage_url: Base URL of opa-quotes-storage service
         timeout: HTTP request timeout in seconds
+        content_encoding: Request body encoding ("json" or "msgpack")
         circuit_breaker: CircuitBreaker instance for resilience
         
     Example:
@@ -42,7 +83,8 @@ class StoragePublisher(BasePublisher):
         storage_url: str,
         timeout: int = 10,
         circuit_breaker_threshold: int = 5,
-        circuit_breaker_timeout: int = 60
+        circuit_breaker_timeout: int = 60,
+        content_encoding: ContentEncoding = "json"
     ):
         """Initialize storage publisher.
         
@@ -51,9 +93,23 @@ class StoragePublisher(BasePublisher):
             timeout: HTTP request timeout in seconds
             circuit_breaker_threshold: Failures before circuit opens
             circuit_breaker_timeout: Seconds before circuit half-opens
+            content_encoding: Request body encoding; "msgpack" sends
+                MessagePack (requires msgspec from the `speedups` extra)
+            
+        Raises:
+            ValueError: If content_encoding is unknown or msgpack is requested
+                without msgspec installed
         """
+        if content_encoding not in _CONTENT_TYPES:
+            raise ValueError(f"Unsupported content_encoding: {content_encoding}")
+        if content_encoding == "msgpack" and msgspec is None:
+            raise ValueError("content_encoding='msgpack' requires msgspec")
+        
         self.storage_url = storage_url.rstrip('/')
         self.timeout = timeout
+        self.content_encoding = content_encoding
+        # Persistent client (created on first publish) keeps connections warm
+        self._client: Optional[httpx.AsyncClient] = None
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=circuit_breaker_threshold,
             timeout=circuit_breaker_timeout,
@@ -61,7 +117,8 @@ class StoragePublisher(BasePublisher):
         )
         logger.info(
             f"StoragePublisher initialized: storage_url={storage_url}, "
-            f"timeout={timeout}s, circuit_breaker_threshold={circuit_breaker_threshold}"
+            f"timeout={timeout}s, circuit_breaker_threshold={circuit_breaker_threshold}, "
+            f"content_encoding={content_encoding}"
         )
     
     async def publish_batch(self, quotes: List[Quote]) -> int:
@@ -97,9 +154,7 @@ class StoragePublisher(BasePublisher):
         
         try:
             # Use circuit breaker for resilience
-            result = await self.circuit_breaker.call(
-                lambda: self._post_quotes(quotes)
-            )
+            result = await self.circuit_breaker.call(self._post_quotes, quotes)
             
             inserted = result.get('inserted', 0)
             errors = result.get('errors', 0)
@@ -123,6 +178,62 @@ class StoragePublisher(BasePublisher):
             )
             raise PublisherError(f"Storage publish failed: {e}") from e
     
+    @staticmethod
+    def _to_wire(quotes: List[Quote]) -> List[Any]:
+        """Map quotes to the opa-quotes-api wire schema.
+        
+        This is the only place the Quote → wire mapping lives (price is sent
+        as close); every body encoding goes through it.
+        
+        Args:
+            quotes: List of Quote objects
+            
+        Returns:
+            StorageQuoteWire structs when msgspec is installed, otherwise
+            dicts with the same fields in the same order
+        """
+        rows = [
+            (q.ticker, q.timestamp, q.price, q.open, q.high, q.low, q.volume, q.source)
+            for q in quotes
+        ]
+        if StorageQuoteWire is not None:
+            return [StorageQuoteWire(*row) for row in rows]
+        return [dict(zip(_WIRE_FIELDS, row)) for row in rows]
+    
+    @staticmethod
+    def _encode_payload(quotes: List[Quote]) -> bytes:
+        """Encode quotes as the opa-quotes-api batch JSON body.
+        
+        The whole body is encoded in one pass, timestamps included (RFC 3339,
+        UTC as "Z"), using msgspec structs when installed, otherwise plain
+        dicts encoded by pydantic-core. Both produce the same JSON.
+        
+        Args:
+            quotes: List of Quote objects
+            
+        Returns:
+            JSON body as bytes
+        """
+        body = {"quotes": StoragePublisher._to_wire(quotes)}
+        if StorageQuoteWire is not None:
+            return _encode_json(body)
+        return to_json(body)
+    
+    @staticmethod
+    def _encode_payload_msgpack(quotes: List[Quote]) -> bytes:
+        """Encode quotes as a MessagePack batch body.
+        
+        Same structure as the JSON body; timestamps use the MessagePack
+        timestamp extension type. Requires msgspec.
+        
+        Args:
+            quotes: List of Quote objects
+            
+        Returns:
+            MessagePack body as bytes
+        """
+        return _encode_msgpack({"quotes": StoragePublisher._to_wire(quotes)})
+    
     async def _post_quotes(self, quotes: List[Quote]) -> Dict[str, Any]:
         """POST quotes to storage API (internal method).
         
@@ -136,56 +247,61 @@ class StoragePublisher(BasePublisher):
             httpx.HTTPStatusError: If HTTP request fails
             httpx.RequestError: If network request fails
         """
-        # Convert quotes to dict format compatible with opa-quotes-api schema
-        quotes_data = []
-        for q in quotes:
-            quote_dict = {
-                "ticker": q.ticker,
-                "timestamp": q.timestamp.isoformat() if hasattr(q.timestamp, 'isoformat') else q.timestamp,
-                "close": q.price,  # Map price → close for API compatibility
-                "open": q.open,
-                "high": q.high,
-                "low": q.low,
-                "volume": q.volume,
-                "source": q.source
-            }
-            quotes_data.append(quote_dict)
-        
-        payload = {"quotes": quotes_data}
-        
-        logger.debug(f"Posting {len(quotes_data)} quotes to {self.storage_url}/v1/quotes/batch")
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    f"{self.storage_url}/v1/quotes/batch",
-                    json=payload
-                )
-                
-                # Raise exception for 4xx/5xx status codes
-                response.raise_for_status()
-                
-                result = response.json()
-                logger.debug(f"Storage response: {result}")
-                
-                return result
-                
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP error from storage: status={e.response.status_code}, "
-                    f"body={e.response.text}"
-                )
-                raise
-                
-            except httpx.RequestError as e:
-                logger.error(f"Network error connecting to storage: {e}")
-                raise
-    
-    async def close(self) -> None:
-        """Close any open connections or resources.
+        if self.content_encoding == "msgpack":
+            payload = self._encode_payload_msgpack(quotes)
+        else:
+            payload = self._encode_payload(quotes)
         
-        Currently no persistent resources to close.
+        logger.debug(f"Posting {len(quotes)} quotes to {self.storage_url}/v1/quotes/batch")
+        
+        client = self._get_client()
+        try:
+            response = await client.post(
+                f"{self.storage_url}/v1/quotes/batch",
+                content=payload,
+                headers={
+                    "Content-Type": _CONTENT_TYPES[self.content_encoding],
+                    "Accept": "application/json"
+                }
+            )
+            
+            # Raise exception for 4xx/5xx status codes
+            response.raise_for_status()
+            
+            result = response.json()
+            logger.debug(f"Storage response: {result}")
+            
+            return result
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error from storage: status={e.response.status_code}, "
+                f"body={e.response.text}"
+            )
+            raise
+            
+        except httpx.RequestError as e:
+            logger.error(f"Network error connecting to storage: {e}")
+            raise
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the persistent HTTP client.
+        
+        Returns:
+            httpx.AsyncClient instance reused across batches
         """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         logger.info("StoragePublisher closed")
     
     def get_circuit_state(self) -> str:
@@ -2,23 +2,44 @@
 
 import asyncio
 import logging
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 from datetime import datetime, timezone
+import numpy as np
 import yfinance as yf
 import pandas as pd
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
 
-from opa_quotes_streamer.models.quote import Quote
+from pydantic import ValidationError
+
+try:
+    from curl_cffi import requests as curl_requests
+except ImportError:  # older yfinance: let it manage its own session
+    curl_requests = None
+
+from opa_quotes_streamer.models.quote import Quote, QuoteListAdapter
 from opa_quotes_streamer.sources.base import BaseDataSource
 from opa_quotes_streamer.utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# yfinance price fields in the column order used for vectorized extraction
+_FIELDS = ["Close", "Volume", "Open", "High", "Low"]
+
+# Dedicated thread for blocking yf.download calls. download(threads=True)
+# already fans out per ticker internally, and yfinance 0.2.x keeps download
+# results in module-global state, so calls must not run concurrently.
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yfinance")
+
+# Network errors worth retrying. curl_cffi's exceptions derive from OSError,
+# not from the builtin ConnectionError/TimeoutError, so list them explicitly.
+_TRANSIENT_ERRORS: tuple = (ConnectionError, TimeoutError)
+if curl_requests is not None:
+    _TRANSIENT_ERRORS += (
+        curl_requests.exceptions.ConnectionError,
+        curl_requests.exceptions.Timeout,
+    )
+
 
 class YFinanceError(Exception):
     """Exception raised for Yahoo Finance specific errors."""
@@ -37,6 +58,10 @@ class YFinanceSource(BaseDataSource):
     Attributes:
         rate_limiter: RateLimiter instance for API throttling
         max_retries: Maximum retry attempts for failed requests
+        on_fetch_latency: Optional hook called as (latency_ns, n_quotes) after
+            each successful fetch (latency includes rate limiter wait)
+        on_quotes: Optional hook called with each non-empty fetched batch
+        on_fetch_error: Optional hook called with the exception of a failed fetch
         
     Example:
         >>> source = YFinanceSource(max_requests_per_hour=2000)
@@ -57,6 +82,13 @@ class YFinanceSource(BaseDataSource):
         """
         self.rate_limiter = RateLimiter(max_requests_per_hour=max_requests_per_hour)
         self.max_retries = max_retries
+        # Persistent HTTP session (created on first fetch) keeps connections warm
+        self._session = None
+        
+        # Instrumentation hooks (e.g. benchmark), None = disabled
+        self.on_fetch_latency: Optional[Callable[[int, int], None]] = None
+        self.on_quotes: Optional[Callable[[List[Quote]], None]] = None
+        self.on_fetch_error: Optional[Callable[[Exception], None]] = None
         logger.info(
             f"YFinanceSource initialized with rate limit: {max_requests_per_hour} req/h"
         )
@@ -79,6 +111,7 @@ class YFinanceSource(BaseDataSource):
         
         logger.info(f"Fetching quotes for {len(tickers)} tickers: {tickers}")
         
+        fetch_start = time.perf_counter_ns()
         try:
             # Acquire rate limiter token
             await self.rate_limiter.acquire()
@@ -86,22 +119,26 @@ class YFinanceSource(BaseDataSource):
             # Fetch with retry logic
             quotes = await self._fetch_with_retry(tickers)
             
-            logger.info(f"Successfully fetched {len(quotes)} quotes")
-            return quotes
-            
         except Exception as e:
+            if self.on_fetch_error is not None:
+                self.on_fetch_error(e)
             logger.error(f"Failed to fetch quotes for {tickers}: {e}", exc_info=True)
             raise YFinanceError(f"Failed to fetch quotes: {e}") from e
+        
+        if self.on_fetch_latency is not None:
+            self.on_fetch_latency(time.perf_counter_ns() - fetch_start, len(quotes))
+        if quotes and self.on_quotes is not None:
+            self.on_quotes(quotes)
+        
+        logger.info(f"Successfully fetched {len(quotes)} quotes")
+        return quotes
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ConnectionError, TimeoutError)),
-        reraise=True
-    )
     async def _fetch_with_retry(self, tickers: List[str]) -> List[Quote]:
         """Fetch quotes with exponential backoff retry.
         
+        Transient network errors are retried up to max_retries attempts
+        in total, waiting 1s, 2s, 4s... (capped at 10s) between attempts.
+        
         Args:
             tickers: List of ticker symbols
             
@@ -111,13 +148,27 @@ class YFinanceSource(BaseDataSource):
         Raises:
             Exception: If fetching fails after retries
         """
-        # Run yfinance in thread pool (it's blocking I/O)
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            None,
-            self._fetch_yfinance_data,
-            tickers
-        )
+        # Run yfinance in its own thread (it's blocking I/O)
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            try:
+                data = await loop.run_in_executor(
+                    _FETCH_EXECUTOR,
+                    self._fetch_yfinance_data,
+                    tickers
+                )
+                break
+            except _TRANSIENT_ERRORS as e:
+                attempt += 1
+                if attempt >= self.max_retries:
+                    raise
+                delay = min(10, 2 ** (attempt - 1))
+                logger.warning(
+                    f"Fetch attempt {attempt}/{self.max_retries} failed: {e}; "
+                    f"retrying in {delay}s"
+                )
+                await asyncio.sleep(delay)
         
         # Convert to Quote objects
         quotes = self._convert_to_quotes(data, tickers)
@@ -130,20 +181,25 @@ class YFinanceSource(BaseDataSource):
             tickers: List of ticker symbols
             
         Returns:
-            DataFrame with quote data
+            DataFrame of daily bars (current and previous session)
             
         Raises:
-            YFinanceError: If fetching fails
+            ConnectionError, TimeoutError: On transient network errors
+                (including curl_cffi's equivalents), for the caller to retry
+            YFinanceError: If fetching fails otherwise
         """
         try:
-            # Download latest quotes (1 day period, 1 minute interval)
+            # Two daily bars per ticker: the last one is the live session
+            # (close = latest price), the one before gives previous_close.
+            # Much smaller than a full day of 1-minute bars.
             tickers_str = " ".join(tickers)
             data = yf.download(
                 tickers_str,
-                period="1d",
-                interval="1m",
+                period="2d",
+                interval="1d",
                 progress=False,
-                threads=True
+                threads=True,
+                session=self._get_session()
             )
             
             if data.empty:
@@ -152,6 +208,9 @@ class YFinanceSource(BaseDataSource):
             
             return data
             
+        except _TRANSIENT_ERRORS:
+            # Unwrapped so _fetch_with_retry can retry them
+            raise
         except Exception as e:
             logger.error(f"yfinance.download failed: {e}")
             raise YFinanceError(f"yfinance download error: {e}") from e
@@ -163,6 +222,10 @@ class YFinanceSource(BaseDataSource):
     ) -> List[Quote]:
         """Convert yfinance DataFrame to Quote objects.
         
+        Quote fields for all tickers are extracted in one vectorized pass and
+        the whole batch is validated in a single call; tickers failing
+        validation are dropped.
+        
         Args:
             data: yfinance DataFrame
             tickers: List of ticker symbols
@@ -170,103 +233,121 @@ class YFinanceSource(BaseDataSource):
         Returns:
             List of Quote objects
         """
-        quotes = []
+        rows = []
         
         if data.empty:
-            return quotes
+            return []
         
         try:
-            # Get latest row (most recent data)
-            latest_data = data.tail(1)
-            
-            for ticker in tickers:
-                try:
-                    quote = self._create_quote_from_data(ticker, latest_data, data)
-                    if quote:
-                        quotes.append(quote)
-                except Exception as e:
-                    logger.error(f"Failed to create quote for {ticker}: {e}")
-                    continue
+            # All quotes of one fetch share the same timestamp
+            now = datetime.now(timezone.utc)
+            rows = self._extract_quote_rows(data, tickers, now)
             
         except Exception as e:
             logger.error(f"Error converting data to quotes: {e}")
         
-        return quotes
+        return self._validate_quote_rows(rows)
     
-    def _create_quote_from_data(
+    def _extract_quote_rows(
         self,
-        ticker: str,
-        latest_data: pd.DataFrame,
-        full_data: pd.DataFrame
-    ) -> Optional[Quote]:
-        """Create a Quote object from yfinance data.
+        data: pd.DataFrame,
+        tickers: List[str],
+        timestamp: datetime
+    ) -> List[dict]:
+        """Extract Quote fields for all tickers of a yfinance DataFrame.
+        
+        The last row is reshaped once into a (tickers, fields) float array and
+        the close/volume mask is computed on the whole array, so per-ticker
+        work is plain indexing instead of pandas lookups and pd.isna calls.
+        Tickers absent from the frame or missing close/volume are skipped.
+        Single-ticker frames (flat columns) apply their one row to every
+        ticker, as the per-ticker extraction does.
         
         Args:
-            ticker: Ticker symbol
-            latest_data: Latest row from DataFrame
-            full_data: Full DataFrame for additional data
+            data: yfinance DataFrame with (field, ticker) or flat field columns
+            tickers: List of ticker symbols
+            timestamp: Quote timestamp (UTC) shared by the batch
             
         Returns:
-            Quote object or None if data insufficient
+            List of Quote field dicts (not yet validated)
         """
-        try:
-            # Handle multi-index columns (multiple tickers)
-            if isinstance(latest_data.columns, pd.MultiIndex):
-                close = latest_data[('Close', ticker)].iloc[0]
-                volume = latest_data[('Volume', ticker)].iloc[0]
-                
-                # Optional fields
-                open_price = latest_data.get(('Open', ticker))
-                high = latest_data.get(('High', ticker))
-                low = latest_data.get(('Low', ticker))
-            else:
-                # Single ticker case
-                close = latest_data['Close'].iloc[0]
-                volume = latest_data['Volume'].iloc[0]
-                
-                open_price = latest_data.get('Open')
-                high = latest_data.get('High')
-                low = latest_data.get('Low')
-            
-            # Validate essential data
-            if pd.isna(close) or pd.isna(volume):
+        # Coerce to float up front (object columns may hold pd.NA)
+        last = pd.to_numeric(data.iloc[-1], errors="coerce")
+        prev_close = np.full(len(tickers), np.nan)
+        
+        if isinstance(data.columns, pd.MultiIndex):
+            arr = last.unstack(level=0).reindex(index=tickers, columns=_FIELDS).to_numpy()
+            if len(data) > 1:
+                prev_close = (
+                    pd.to_numeric(data.iloc[-2].xs("Close", level=0), errors="coerce")
+                    .reindex(tickers)
+                    .to_numpy()
+                )
+        else:
+            arr = np.tile(last.reindex(_FIELDS).to_numpy(), (len(tickers), 1))
+            if len(data) > 1 and "Close" in data.columns:
+                prev_close[:] = pd.to_numeric(data["Close"].iloc[-2:-1], errors="coerce").iloc[0]
+        
+        # Essential fields mask for the whole batch (NaN in close or volume)
+        missing = np.isnan(arr[:, :2]).any(axis=1)
+        
+        rows = []
+        for ticker, is_missing, values, prev in zip(
+            tickers, missing.tolist(), arr.tolist(), prev_close.tolist()
+        ):
+            if is_missing:
                 logger.warning(f"Missing essential data for {ticker}")
-                return None
-            
-            # Get previous close (if available)
-            previous_close = None
-            if len(full_data) > 1:
-                prev_data = full_data.tail(2).head(1)
-                if isinstance(prev_data.columns, pd.MultiIndex):
-                    prev_close_val = prev_data[('Close', ticker)].iloc[0]
-                else:
-                    prev_close_val = prev_data['Close'].iloc[0]
-                if not pd.isna(prev_close_val):
-                    previous_close = float(prev_close_val)
+                continue
+            # NaN != NaN: optional fields become None
+            close, volume, open_price, high, low = values
+            rows.append({
+                "ticker": ticker,
+                "price": close,
+                "volume": int(volume),
+                "timestamp": timestamp,
+                "source": "yfinance",
+                "open": open_price if open_price == open_price else None,
+                "high": high if high == high else None,
+                "low": low if low == low else None,
+                "previous_close": prev if prev == prev else None
+            })
+        return rows
+    
+    def _validate_quote_rows(self, rows: List[dict]) -> List[Quote]:
+        """Validate extracted quote rows as one batch.
+        
+        Args:
+            rows: Quote field dicts
             
-            # Create Quote
-            quote = Quote(
-                ticker=ticker,
-                price=float(close),
-                volume=int(volume),
-                timestamp=datetime.now(timezone.utc),
-                source="yfinance",
-                open=float(open_price.iloc[0]) if open_price is not None and not pd.isna(open_price.iloc[0]) else None,
-                high=float(high.iloc[0]) if high is not None and not pd.isna(high.iloc[0]) else None,
-                low=float(low.iloc[0]) if low is not None and not pd.isna(low.iloc[0]) else None,
-                previous_close=previous_close
+        Returns:
+            List of Quote objects for the rows that passed validation
+        """
+        try:
+            return QuoteListAdapter.validate_python(rows)
+        except ValidationError as e:
+            bad = {}
+            for err in e.errors():
+                bad.setdefault(err['loc'][0], []).append(err['msg'])
+            for i, msgs in bad.items():
+                logger.error(f"Invalid quote data for {rows[i]['ticker']}: {'; '.join(msgs)}")
+            return QuoteListAdapter.validate_python(
+                [row for i, row in enumerate(rows) if i not in bad]
             )
-            
-            logger.debug(f"Created quote for {ticker}: price={quote.price}, volume={quote.volume}")
-            return quote
-            
-        except (KeyError, IndexError, ValueError) as e:
-            logger.error(f"Error extracting data for {ticker}: {e}")
-            return None
     
-    async def close(self) -> None:
-        """Close any open connections or resources.
+    def _get_session(self):
+        """Get or create the persistent yfinance HTTP session.
         
-        Currently no resources to close for yfinance.
+        Returns:
+            curl_cffi Session reused across fetches, or None when curl_cffi
+            is not available (yfinance then uses its default session)
         """
+        if self._session is None and curl_requests is not None:
+            self._session = curl_requests.Session(impersonate="chrome")
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the persistent HTTP session, if any."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         logger.info("YFinanceSource closed")
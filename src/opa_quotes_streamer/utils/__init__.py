@@ -2,10 +2,13 @@
 
 from .rate_limiter import RateLimiter
 from .circuit_breaker import CircuitBreaker, CircuitState, CircuitBreakerOpenError
+from .quantile import P2Quantile, StreamingPercentiles
 
 __all__ = [
     "RateLimiter",
     "CircuitBreaker",
     "CircuitState",
     "CircuitBreakerOpenError",
+    "P2Quantile",
+    "StreamingPercentiles",
 ]
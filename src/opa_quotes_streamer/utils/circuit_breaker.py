@@ -1,5 +1,6 @@
 """Circuit breaker pattern implementation for fault tolerance."""
 
+import asyncio
 import time
 from enum import Enum
 from typing import Callable, Any, Optional, TypeVar, Awaitable
@@ -17,6 +18,12 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
+# Internal int encoding of CircuitState (cheaper to compare on the hot path)
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_INT_TO_STATE = (CircuitState.CLOSED, CircuitState.OPEN, CircuitState.HALF_OPEN)
+_STATE_TO_INT = {state: i for i, state in enumerate(_INT_TO_STATE)}
+
+
 class CircuitBreakerOpenError(Exception):
     """Exception raised when circuit breaker is open."""
     pass
@@ -29,13 +36,13 @@ class CircuitBreaker:
     The circuit transitions between three states:
     - CLOSED: Normal operation, all requests pass through
     - OPEN: Service is failing, requests are immediately rejected
-    - HALF_OPEN: Testing recovery, limited requests allowed
+    - HALF_OPEN: Testing recovery, a single probe request allowed at a time
     
     Attributes:
         failure_threshold: Number of failures before opening circuit
         timeout: Seconds to wait before transitioning from OPEN to HALF_OPEN
         failures: Current failure count
-        last_failure_time: Timestamp of last failure
+        last_failure_time: Clock reading at the last failure
         state: Current circuit state
     
     Example:
@@ -50,7 +57,8 @@ class CircuitBreaker:
         self,
         failure_threshold: int = 5,
         timeout: int = 60,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        clock: Optional[Callable[[], float]] = None
     ):
         """Initialize circuit breaker.
         
@@ -58,6 +66,10 @@ class CircuitBreaker:
             failure_threshold: Number of consecutive failures before opening circuit
             timeout: Seconds to wait in OPEN state before trying HALF_OPEN
             name: Optional name for logging purposes
+            clock: Time source in seconds for tests; defaults to
+                time.monotonic. When given, no OPEN -> HALF_OPEN timer is
+                scheduled (it would run on real time); the transition then
+                happens lazily on the next call, driven by this clock.
         """
         if failure_threshold <= 0:
             raise ValueError("failure_threshold must be positive")
@@ -68,89 +80,223 @@ class CircuitBreaker:
         self.timeout = timeout
         self.failures = 0
         self.last_failure_time: Optional[float] = None
-        self.state = CircuitState.CLOSED
+        self._clock = clock or time.monotonic
+        self._use_timer = clock is None
+        self._state = _CLOSED
         self.name = name or "unnamed"
         self._success_count_half_open = 0
+        self._probe_in_flight = False
+        self._half_open_timer: Optional[asyncio.TimerHandle] = None
+    
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        return _INT_TO_STATE[self._state]
     
-    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+    @state.setter
+    def state(self, value: CircuitState) -> None:
+        self._state = _STATE_TO_INT[CircuitState(value)]
+    
+    async def call(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
         """Execute function with circuit breaker protection.
         
         Args:
             func: Async function to execute
+            *args: Positional arguments passed to func (avoids wrapping
+                bound methods in a lambda per call)
+            
+        Returns:
+            Result of func(*args) execution
+            
+        Raises:
+            CircuitBreakerOpenError: If circuit is OPEN
+            Exception: Original exception from func() if circuit is CLOSED/HALF_OPEN
+        """
+        # Read state once; it is only written back at transitions
+        state = self._state
+        
+        # Fast path: steady-state CLOSED skips the state machine on success
+        if state == _CLOSED:
+            try:
+                result = await func(*args)
+            except Exception as e:
+                self.record_failure(e)
+                raise
+            if self._state == _CLOSED:
+                self.failures = 0
+            return result
+        
+        self._begin_probe(state)
+        try:
+            result = await func(*args)
+        except Exception as e:
+            self._probe_failed(e)
+            raise
+        finally:
+            self._probe_in_flight = False
+        self._probe_succeeded()
+        return result
+    
+    def call_sync(self, func: Callable[..., T], *args: Any) -> T:
+        """Execute a synchronous function with circuit breaker protection.
+        
+        Same state machine as call(), without creating a coroutine.
+        
+        Args:
+            func: Function to execute
+            *args: Positional arguments passed to func
             
         Returns:
-            Result of func() execution
+            Result of func(*args) execution
             
         Raises:
             CircuitBreakerOpenError: If circuit is OPEN
             Exception: Original exception from func() if circuit is CLOSED/HALF_OPEN
         """
-        # Check if we should transition from OPEN to HALF_OPEN
-        if self.state == CircuitState.OPEN:
-            if self.last_failure_time and \
-               time.time() - self.last_failure_time >= self.timeout:
+        state = self._state
+        
+        if state == _CLOSED:
+            try:
+                result = func(*args)
+            except Exception as e:
+                self.record_failure(e)
+                raise
+            if self._state == _CLOSED:
+                self.failures = 0
+            return result
+        
+        self._begin_probe(state)
+        try:
+            result = func(*args)
+        except Exception as e:
+            self._probe_failed(e)
+            raise
+        finally:
+            self._probe_in_flight = False
+        self._probe_succeeded()
+        return result
+    
+    def _begin_probe(self, state: int) -> None:
+        """Admit the caller as the HALF_OPEN probe or reject it.
+        
+        Args:
+            state: Circuit state read at call entry (not CLOSED)
+            
+        Raises:
+            CircuitBreakerOpenError: If OPEN (timeout not elapsed) or a probe
+                is already in flight
+        """
+        # OPEN: reject until the timeout has elapsed, then admit a probe.
+        # Normally the half-open timer has already moved the state on; this
+        # check covers circuits opened outside a running event loop.
+        if state == _OPEN:
+            if self.last_failure_time is not None and \
+               self._clock() - self.last_failure_time >= self.timeout:
                 logger.info(
-                    f"Circuit breaker '{self.name}' transitioning to HALF_OPEN "
-                    f"after {self.timeout}s timeout"
+                    "Circuit breaker '%s' transitioning to HALF_OPEN after %ss timeout",
+                    self.name, self.timeout
                 )
-                self.state = CircuitState.HALF_OPEN
+                self._state = _HALF_OPEN
                 self._success_count_half_open = 0
             else:
-                logger.warning(
-                    f"Circuit breaker '{self.name}' is OPEN, rejecting call"
-                )
+                logger.warning("Circuit breaker '%s' is OPEN, rejecting call", self.name)
                 raise CircuitBreakerOpenError(
                     f"Circuit breaker '{self.name}' is OPEN"
                 )
         
-        try:
-            # Execute the function
-            result = await func()
-            
-            # On success in HALF_OPEN, transition to CLOSED
-            if self.state == CircuitState.HALF_OPEN:
-                self._success_count_half_open += 1
-                logger.info(
-                    f"Circuit breaker '{self.name}' successful call in HALF_OPEN "
-                    f"(success count: {self._success_count_half_open})"
-                )
-                
-                # After first success in HALF_OPEN, close the circuit
-                self.state = CircuitState.CLOSED
-                self.failures = 0
-                logger.info(
-                    f"Circuit breaker '{self.name}' transitioned to CLOSED"
-                )
-            
-            # Reset failure count on success in CLOSED state
-            if self.state == CircuitState.CLOSED:
-                self.failures = 0
-            
-            return result
-            
-        except Exception as e:
-            # Increment failure count
-            self.failures += 1
+        # HALF_OPEN: exactly one probe at a time. The check-and-set runs
+        # without awaiting, so it is atomic on the event loop.
+        if self._probe_in_flight:
+            logger.warning(
+                "Circuit breaker '%s' is HALF_OPEN with a probe in flight, rejecting call",
+                self.name
+            )
+            raise CircuitBreakerOpenError(
+                f"Circuit breaker '{self.name}' is HALF_OPEN (probe in flight)"
+            )
+        self._probe_in_flight = True
+    
+    def _probe_failed(self, error: Exception) -> None:
+        """Count a failed probe and reopen the circuit."""
+        self.record_failure(error)
+        # Failed probe: back to OPEN for another full timeout
+        if self._state != _OPEN:
+            self._open()
+            logger.error("Circuit breaker '%s' probe failed, reopened", self.name)
+    
+    def _probe_succeeded(self) -> None:
+        """Close the circuit after a successful probe."""
+        self._success_count_half_open += 1
+        logger.info(
+            "Circuit breaker '%s' successful call in HALF_OPEN (success count: %d)",
+            self.name, self._success_count_half_open
+        )
+        
+        # After first success in HALF_OPEN, close the circuit
+        self._state = _CLOSED
+        self.failures = 0
+        logger.info("Circuit breaker '%s' transitioned to CLOSED", self.name)
+    
+    def record_failure(self, error: Exception) -> None:
+        """Count a failed call, opening the circuit at the threshold.
+        
+        Args:
+            error: Exception raised by the failed call (for logging)
+        """
+        self.failures += 1
+        logger.error(
+            "Circuit breaker '%s' call failed (failures: %d/%d): %s",
+            self.name, self.failures, self.failure_threshold, error
+        )
+        
+        # Open circuit if threshold exceeded
+        if self.failures >= self.failure_threshold:
+            self._open()
             logger.error(
-                f"Circuit breaker '{self.name}' call failed "
-                f"(failures: {self.failures}/{self.failure_threshold}): {e}"
+                "Circuit breaker '%s' opened after %d failures", self.name, self.failures
             )
-            
-            # Open circuit if threshold exceeded
-            if self.failures >= self.failure_threshold:
-                self.state = CircuitState.OPEN
-                self.last_failure_time = time.time()
-                logger.error(
-                    f"Circuit breaker '{self.name}' opened after "
-                    f"{self.failures} failures"
-                )
-            
-            raise
+    
+    def _open(self) -> None:
+        """Move to OPEN and schedule the OPEN -> HALF_OPEN transition.
+        
+        The timer advances the state after `timeout` seconds even if no call
+        arrives, so get_state() (and the metrics reading it) never report a
+        stale OPEN. Without a running event loop, or with an injected clock,
+        call() checks lazily instead.
+        """
+        self._state = _OPEN
+        self.last_failure_time = self._clock()
+        self._cancel_half_open_timer()
+        if not self._use_timer:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._half_open_timer = loop.call_later(self.timeout, self._on_open_timeout)
+    
+    def _on_open_timeout(self) -> None:
+        """Timer callback: OPEN -> HALF_OPEN once the timeout has elapsed."""
+        self._half_open_timer = None
+        if self._state == _OPEN:
+            logger.info(
+                "Circuit breaker '%s' transitioning to HALF_OPEN after %ss timeout",
+                self.name, self.timeout
+            )
+            self._state = _HALF_OPEN
+            self._success_count_half_open = 0
+    
+    def _cancel_half_open_timer(self) -> None:
+        """Cancel a pending OPEN -> HALF_OPEN timer, if any."""
+        if self._half_open_timer is not None:
+            self._half_open_timer.cancel()
+            self._half_open_timer = None
     
     def reset(self) -> None:
         """Manually reset circuit breaker to CLOSED state."""
-        logger.info(f"Circuit breaker '{self.name}' manually reset to CLOSED")
-        self.state = CircuitState.CLOSED
+        logger.info("Circuit breaker '%s' manually reset to CLOSED", self.name)
+        self._cancel_half_open_timer()
+        self._state = _CLOSED
         self.failures = 0
         self.last_failure_time = None
         self._success_count_half_open = 0
@@ -161,7 +307,7 @@ class CircuitBreaker:
         Returns:
             Current CircuitState
         """
-        return self.state
+        return _INT_TO_STATE[self._state]
     
     def get_failure_count(self) -> int:
         """Get current failure count.
@@ -0,0 +1,161 @@
+"""Streaming quantile estimation (P² algorithm) for latency tracking."""
+
+from typing import Dict, Iterable, List
+
+
+class P2Quantile:
+    """Online estimator for a single quantile using the P² algorithm.
+
+    Implements Jain & Chlamtac's P² algorithm: keeps five markers whose
+    heights are adjusted with piecewise-parabolic interpolation on every
+    observation. Each update is O(1) and memory is constant, so no sample
+    buffer is kept or sorted.
+
+    Attributes:
+        quantile: Target quantile in the open interval (0, 1)
+        count: Number of observations seen so far
+
+    Example:
+        >>> p99 = P2Quantile(0.99)
+        >>> for latency in latencies:
+        ...     p99.update(latency)
+        >>> p99.value()
+    """
+
+    def __init__(self, quantile: float):
+        """Initialize estimator.
+
+        Args:
+            quantile: Target quantile (e.g. 0.99 for p99)
+        """
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1 (exclusive)")
+
+        self.quantile = quantile
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4.0]
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def update(self, x: float) -> None:
+        """Add an observation.
+
+        Args:
+            x: Observed value
+        """
+        self.count += 1
+        q = self._heights
+
+        # Bootstrap: collect the first five observations as marker heights
+        if self.count <= 5:
+            q.append(x)
+            if self.count == 5:
+                q.sort()
+            return
+
+        n = self._positions
+
+        # Find the cell k such that q[k] <= x < q[k+1], extending extremes
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Adjust the three middle markers if they drifted from desired positions
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] = self._linear(i, step)
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        """Piecewise-parabolic (P²) prediction for marker i moved by d."""
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, d: int) -> float:
+        """Linear prediction for marker i moved by d (fallback)."""
+        q, n = self._heights, self._positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+    def value(self) -> float:
+        """Get current quantile estimate.
+
+        Returns:
+            Estimated quantile (0.0 if no observations yet). With fewer than
+            five observations the exact nearest-lower sample is returned.
+        """
+        if self.count == 0:
+            return 0.0
+        if self.count < 5:
+            samples = sorted(self._heights)
+            return samples[int((len(samples) - 1) * self.quantile)]
+        return self._heights[2]
+
+
+class StreamingPercentiles:
+    """Set of P² estimators tracking several percentiles of one stream.
+
+    Attributes:
+        count: Number of observations seen so far
+
+    Example:
+        >>> tracker = StreamingPercentiles((50, 95, 99))
+        >>> tracker.update(12.5)
+        >>> tracker.percentile(99)
+    """
+
+    def __init__(self, percentiles: Iterable[float] = (50, 95, 99)):
+        """Initialize tracker.
+
+        Args:
+            percentiles: Percentiles to track, in the range (0, 100)
+        """
+        self._estimators: Dict[float, P2Quantile] = {
+            p: P2Quantile(p / 100) for p in percentiles
+        }
+        self.count = 0
+
+    def update(self, x: float) -> None:
+        """Add an observation to every tracked percentile.
+
+        Args:
+            x: Observed value
+        """
+        self.count += 1
+        for estimator in self._estimators.values():
+            estimator.update(x)
+
+    def percentile(self, p: float) -> float:
+        """Get current estimate for a tracked percentile.
+
+        Args:
+            p: Percentile (must be one of those passed at construction)
+
+        Returns:
+            Estimated value (0.0 if no observations yet)
+
+        Raises:
+            KeyError: If p is not tracked
+        """
+        return self._estimators[p].value()
@@ -2,7 +2,13 @@
 
 import asyncio
 import time
-from typing import Optional
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+
+# Fixed-point token accounting: one token = MICROTOKENS integer units
+MICROTOKENS = 1_000_000
+_NS_PER_HOUR = 3_600_000_000_000
 
 
 class RateLimiter:
@@ -11,12 +17,24 @@ class RateLimiter:
     This implementation uses the token bucket algorithm to limit requests per hour.
     Tokens are automatically refilled based on elapsed time.
     
+    No lock is needed: refill and check-and-take run without awaiting, so they
+    are atomic on the (single-threaded) event loop. Callers that must wait are
+    queued and served in FIFO order by a single timer that fires when the
+    next token is due, so N waiters cost N wake-ups. Not safe to share
+    across threads.
+    
+    Tokens are kept as integer microtokens and refilled from monotonic
+    nanoseconds with exact integer arithmetic (the division remainder is
+    carried over), so the bucket never drifts however often it is refilled.
+    
     Attributes:
         capacity: Maximum number of tokens (requests) that can be stored
+        capacity_u: Capacity in microtokens
         tokens: Current number of available tokens
+        tokens_u: Current number of available microtokens
         refill_rate: Tokens refilled per second
-        last_refill: Timestamp of last token refill
-        lock: Async lock for thread-safe token operations
+        last_refill: Monotonic timestamp of last token refill (seconds)
+        last_refill_ns: Monotonic timestamp of last token refill (nanoseconds)
     
     Example:
         >>> limiter = RateLimiter(max_requests_per_hour=2000)
@@ -24,20 +42,44 @@ class RateLimiter:
         >>> # Make API request here
     """
     
-    def __init__(self, max_requests_per_hour: int):
+    def __init__(
+        self,
+        max_requests_per_hour: int,
+        clock: Callable[[], int] = time.monotonic_ns
+    ):
         """Initialize rate limiter.
         
         Args:
             max_requests_per_hour: Maximum requests allowed per hour
+            clock: Monotonic time source in nanoseconds (injectable for tests)
         """
         if max_requests_per_hour <= 0:
             raise ValueError("max_requests_per_hour must be positive")
             
         self.capacity = max_requests_per_hour
-        self.tokens = float(max_requests_per_hour)
+        self.capacity_u = max_requests_per_hour * MICROTOKENS
+        self.tokens_u = self.capacity_u
         self.refill_rate = max_requests_per_hour / 3600.0  # Tokens per second
-        self.last_refill = time.time()
-        self.lock = asyncio.Lock()
+        self._seconds_per_token_u = 3600.0 / self.capacity_u  # Refill time per microtoken
+        self._clock = clock
+        self.last_refill_ns = clock()
+        self._refill_remainder = 0  # Sub-microtoken refill carried over
+        self._waiters: Deque[Tuple[asyncio.Future, int]] = deque()  # (future, microtokens)
+        self._wake_handle: Optional[asyncio.TimerHandle] = None
+    
+    @property
+    def tokens(self) -> float:
+        """Current number of available tokens."""
+        return self.tokens_u / MICROTOKENS
+    
+    @tokens.setter
+    def tokens(self, value: float) -> None:
+        self.tokens_u = round(value * MICROTOKENS)
+    
+    @property
+    def last_refill(self) -> float:
+        """Monotonic timestamp of last token refill (seconds)."""
+        return self.last_refill_ns / 1e9
     
     async def acquire(self, timeout: Optional[float] = None) -> bool:
         """Acquire a token, waiting if none available.
@@ -47,35 +89,151 @@ class RateLimiter:
             
         Returns:
             True if token acquired, False if timeout occurred
+        """
+        return await self.acquire_many(1, timeout)
+    
+    async def acquire_many(self, n: int, timeout: Optional[float] = None) -> bool:
+        """Acquire n tokens at once, waiting if not enough are available.
+        
+        Refills once and deducts all n tokens together, so a batch of
+        requests pays one acquisition instead of n.
+        
+        Args:
+            n: Number of tokens (1 to capacity)
+            timeout: Maximum time to wait for the tokens (seconds). None = infinite wait
+            
+        Returns:
+            True if tokens acquired, False if timeout occurred
             
         Raises:
-            asyncio.TimeoutError: If timeout is reached before acquiring token
+            ValueError: If n is not between 1 and capacity
         """
-        start_time = time.time()
+        if not 1 <= n <= self.capacity:
+            raise ValueError(f"n must be between 1 and {self.capacity}")
+        need_u = n * MICROTOKENS
+        
+        # Fast path: tokens available and nobody queued, no await and no lock
+        self._refill()
+        if not self._waiters and self.tokens_u >= need_u:
+            self.tokens_u -= need_u
+            return True
+        
+        if timeout is not None and timeout <= 0:
+            return False
         
-        async with self.lock:
-            await self._refill()
+        # Slow path: queue up; the wake timer hands out tokens in FIFO order
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        entry = (waiter, need_u)
+        self._waiters.append(entry)
+        self._schedule_wake(loop)
+        try:
+            if timeout is None:
+                await waiter
+            else:
+                await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            # Tokens handed out just as the timeout fired still count
+            return waiter.done() and not waiter.cancelled()
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                self._remove_waiter(entry, loop)
+        return True
+    
+    def try_acquire(self, n: int = 1) -> bool:
+        """Take n tokens if available right now, without waiting.
+        
+        Args:
+            n: Number of tokens (1 to capacity)
             
-            while self.tokens < 1:
-                if timeout is not None:
-                    elapsed = time.time() - start_time
-                    if elapsed >= timeout:
-                        return False
-                
-                await asyncio.sleep(0.1)
-                await self._refill()
+        Returns:
+            True if tokens were taken, False otherwise (including when other
+            callers are already queued)
             
-            self.tokens -= 1
+        Raises:
+            ValueError: If n is not between 1 and capacity
+        """
+        if not 1 <= n <= self.capacity:
+            raise ValueError(f"n must be between 1 and {self.capacity}")
+        self._refill()
+        need_u = n * MICROTOKENS
+        if not self._waiters and self.tokens_u >= need_u:
+            self.tokens_u -= need_u
             return True
+        return False
+    
+    def _schedule_wake(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Arm the wake timer for when the oldest waiter's tokens are due."""
+        if self._wake_handle is None and self._waiters:
+            self._wake_handle = loop.call_later(
+                self._time_to_tokens(self._waiters[0][1]), self._wake_waiters, loop
+            )
     
-    async def _refill(self) -> None:
-        """Refill tokens based on elapsed time since last refill."""
-        now = time.time()
-        elapsed = now - self.last_refill
-        refill_amount = elapsed * self.refill_rate
+    def _remove_waiter(
+        self, entry: Tuple[asyncio.Future, int], loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Drop a timed-out or cancelled waiter from the queue.
         
-        self.tokens = min(self.capacity, self.tokens + refill_amount)
-        self.last_refill = now
+        If it was the head, the wake timer was armed for its token need, so
+        re-arm it for the new head instead of leaving it on a stale deadline.
+        """
+        waiters = self._waiters
+        if waiters and waiters[0] is entry:
+            waiters.popleft()
+            if self._wake_handle is not None:
+                self._wake_handle.cancel()
+                self._wake_handle = None
+            self._refill()
+            self._schedule_wake(loop)
+            return
+        try:
+            waiters.remove(entry)
+        except ValueError:
+            pass
+    
+    def _wake_waiters(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Give available tokens to queued waiters, oldest first."""
+        self._wake_handle = None
+        self._refill()
+        waiters = self._waiters
+        while waiters:
+            waiter, need_u = waiters[0]
+            if waiter.done():  # Cancelled or timed out
+                waiters.popleft()
+                continue
+            if self.tokens_u < need_u:
+                break
+            waiters.popleft()
+            self.tokens_u -= need_u
+            waiter.set_result(True)
+        self._schedule_wake(loop)
+    
+    def _refill(self, now_ns: Optional[int] = None) -> None:
+        """Refill tokens based on elapsed time since last refill.
+        
+        Args:
+            now_ns: Current clock reading, if the caller already has it
+        """
+        if now_ns is None:
+            now_ns = self._clock()
+        refill_u, self._refill_remainder = divmod(
+            (now_ns - self.last_refill_ns) * self.capacity_u + self._refill_remainder,
+            _NS_PER_HOUR
+        )
+        self.last_refill_ns = now_ns
+        
+        tokens_u = self.tokens_u + refill_u
+        if tokens_u >= self.capacity_u:
+            tokens_u = self.capacity_u
+            self._refill_remainder = 0
+        self.tokens_u = tokens_u
+    
+    def _time_to_tokens(self, need_u: int = MICROTOKENS) -> float:
+        """Seconds until need_u microtokens are available (0 if available now)."""
+        missing_u = need_u - self.tokens_u
+        if missing_u <= 0:
+            return 0.0
+        return missing_u * self._seconds_per_token_u
     
     def available_tokens(self) -> float:
         """Get current number of available tokens without refilling.
@@ -83,7 +241,7 @@ class RateLimiter:
         Returns:
             Current token count
         """
-        return self.tokens
+        return self.tokens_u / MICROTOKENS
     
     async def wait_time(self) -> float:
         """Calculate approximate wait time until next token is available.
@@ -91,11 +249,5 @@ class RateLimiter:
         Returns:
             Wait time in seconds (0 if tokens available)
         """
-        async with self.lock:
-            await self._refill()
-            
-            if self.tokens >= 1:
-                return 0.0
-            
-            tokens_needed = 1 - self.tokens
-            return tokens_needed / self.refill_rate
+        self._refill()
+        return self._time_to_tokens()
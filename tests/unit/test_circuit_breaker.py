@@ -44,6 +44,49 @@ class TestCircuitBreaker:
         assert breaker.get_state() == CircuitState.CLOSED
         assert breaker.get_failure_count() == 0
     
+    @pytest.mark.asyncio
+    async def test_call_passes_arguments(self):
+        """Test positional arguments are forwarded to the function."""
+        breaker = CircuitBreaker(failure_threshold=3, timeout=1)
+        
+        async def add(a, b):
+            return a + b
+        
+        assert await breaker.call(add, 2, 3) == 5
+    
+    @pytest.mark.asyncio
+    async def test_success_in_closed_state_resets_failures(self):
+        """Test a success on the CLOSED fast path clears earlier failures."""
+        breaker = CircuitBreaker(failure_threshold=3, timeout=1)
+        breaker.record_failure(RuntimeError("boom"))
+        breaker.record_failure(RuntimeError("boom"))
+        
+        async def success_func():
+            return "ok"
+        
+        assert await breaker.call(success_func) == "ok"
+        assert breaker.get_failure_count() == 0
+        assert breaker.get_state() == CircuitState.CLOSED
+    
+    def test_state_property_round_trip(self):
+        """Test state is exposed and assignable as CircuitState."""
+        breaker = CircuitBreaker(failure_threshold=3, timeout=1)
+        
+        breaker.state = CircuitState.HALF_OPEN
+        assert breaker.get_state() is CircuitState.HALF_OPEN
+        
+        breaker.state = "open"  # Enum value accepted too
+        assert breaker.state is CircuitState.OPEN
+    
+    def test_record_failure_opens_at_threshold(self):
+        """Test record_failure opens the circuit once the threshold is hit."""
+        breaker = CircuitBreaker(failure_threshold=2, timeout=1)
+        
+        breaker.record_failure(RuntimeError("boom"))
+        assert breaker.get_state() == CircuitState.CLOSED
+        breaker.record_failure(RuntimeError("boom"))
+        assert breaker.get_state() == CircuitState.OPEN
+    
     @pytest.mark.asyncio
     async def test_failed_call_increments_failures(self):
         """Test that failed calls increment failure count."""
@@ -108,7 +151,8 @@ class TestCircuitBreaker:
     @pytest.mark.asyncio
     async def test_transition_to_half_open_after_timeout(self):
         """Test circuit transitions to HALF_OPEN after timeout."""
-        breaker = CircuitBreaker(failure_threshold=2, timeout=1)
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, timeout=1, clock=lambda: clock[0])
         
         async def failing_func():
             raise ValueError("Test error")
@@ -120,8 +164,8 @@ class TestCircuitBreaker:
         
         assert breaker.get_state() == CircuitState.OPEN
         
-        # Wait for timeout
-        await asyncio.sleep(1.1)
+        # Advance past timeout
+        clock[0] += 1.1
         
         # Next call should transition to HALF_OPEN
         async def success_func():
@@ -135,7 +179,8 @@ class TestCircuitBreaker:
     @pytest.mark.asyncio
     async def test_half_open_success_closes_circuit(self):
         """Test successful call in HALF_OPEN closes circuit."""
-        breaker = CircuitBreaker(failure_threshold=2, timeout=1)
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, timeout=1, clock=lambda: clock[0])
         
         async def failing_func():
             raise ValueError("Test error")
@@ -148,8 +193,8 @@ class TestCircuitBreaker:
             with pytest.raises(ValueError):
                 await breaker.call(failing_func)
         
-        # Wait for timeout to enter HALF_OPEN
-        await asyncio.sleep(1.1)
+        # Advance past timeout to enter HALF_OPEN
+        clock[0] += 1.1
         
         # Success should close circuit
         result = await breaker.call(success_func)
@@ -161,7 +206,8 @@ class TestCircuitBreaker:
     @pytest.mark.asyncio
     async def test_half_open_failure_reopens_circuit(self):
         """Test failure in HALF_OPEN reopens circuit."""
-        breaker = CircuitBreaker(failure_threshold=2, timeout=1)
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, timeout=1, clock=lambda: clock[0])
         
         async def failing_func():
             raise ValueError("Test error")
@@ -171,8 +217,8 @@ class TestCircuitBreaker:
             with pytest.raises(ValueError):
                 await breaker.call(failing_func)
         
-        # Wait for timeout
-        await asyncio.sleep(1.1)
+        # Advance past timeout
+        clock[0] += 1.1
         
         # Failure in HALF_OPEN should reopen
         with pytest.raises(ValueError):
@@ -182,6 +228,92 @@ class TestCircuitBreaker:
         # Actually, single failure in HALF_OPEN counts towards threshold
         assert breaker.get_failure_count() >= 1
     
+    @pytest.mark.asyncio
+    async def test_open_moves_to_half_open_without_calls(self):
+        """Test the OPEN -> HALF_OPEN transition happens on time, not on call."""
+        breaker = CircuitBreaker(failure_threshold=1, timeout=0.05)
+        
+        breaker.record_failure(RuntimeError("boom"))
+        assert breaker.get_state() == CircuitState.OPEN
+        
+        await asyncio.sleep(0.1)
+        
+        assert breaker.get_state() == CircuitState.HALF_OPEN
+    
+    @pytest.mark.asyncio
+    async def test_injected_clock_skips_real_timer(self):
+        """Test an injected clock alone drives OPEN -> HALF_OPEN."""
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, timeout=0.05, clock=lambda: clock[0])
+        
+        breaker.record_failure(RuntimeError("boom"))
+        await asyncio.sleep(0.1)
+        
+        assert breaker._half_open_timer is None
+        assert breaker.get_state() == CircuitState.OPEN  # Real time is ignored
+        
+        clock[0] += 0.05
+        
+        async def success_func():
+            return "success"
+        
+        assert await breaker.call(success_func) == "success"
+        assert breaker.get_state() == CircuitState.CLOSED
+    
+    @pytest.mark.asyncio
+    async def test_reset_cancels_half_open_timer(self):
+        """Test reset() cancels the pending OPEN -> HALF_OPEN transition."""
+        breaker = CircuitBreaker(failure_threshold=1, timeout=0.05)
+        
+        breaker.record_failure(RuntimeError("boom"))
+        breaker.reset()
+        await asyncio.sleep(0.1)
+        
+        assert breaker.get_state() == CircuitState.CLOSED
+    
+    @pytest.mark.asyncio
+    async def test_half_open_allows_single_probe(self):
+        """Test concurrent calls in HALF_OPEN: one probe runs, others rejected."""
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, timeout=1, clock=lambda: clock[0])
+        breaker.state = CircuitState.OPEN
+        breaker.last_failure_time = -2.0  # Timeout elapsed
+        
+        probe_started = asyncio.Event()
+        release = asyncio.Event()
+        
+        async def slow_probe():
+            probe_started.set()
+            await release.wait()
+            return "probe"
+        
+        probe = asyncio.create_task(breaker.call(slow_probe))
+        await probe_started.wait()
+        
+        async def other():
+            return "other"
+        
+        with pytest.raises(CircuitBreakerOpenError, match="probe in flight"):
+            await breaker.call(other)
+        
+        release.set()
+        assert await probe == "probe"
+        assert breaker.get_state() == CircuitState.CLOSED
+    
+    @pytest.mark.asyncio
+    async def test_half_open_probe_failure_reopens(self):
+        """Test a failed probe reopens the circuit even below the threshold."""
+        breaker = CircuitBreaker(failure_threshold=5, timeout=1)
+        breaker.state = CircuitState.HALF_OPEN
+        
+        async def failing_func():
+            raise ValueError("still down")
+        
+        with pytest.raises(ValueError):
+            await breaker.call(failing_func)
+        
+        assert breaker.get_state() == CircuitState.OPEN
+    
     @pytest.mark.asyncio
     async def test_success_resets_failure_count(self):
         """Test successful call resets failure count in CLOSED state."""
@@ -302,3 +434,43 @@ class TestCircuitBreaker:
         
         assert len(results) == 5
         assert breaker.get_state() == CircuitState.CLOSED
+    
+    def test_call_sync_success(self):
+        """Test call_sync runs a plain function and resets failures."""
+        breaker = CircuitBreaker(failure_threshold=3, timeout=1)
+        breaker.failures = 2
+        
+        assert breaker.call_sync(lambda a, b: a + b, 1, 2) == 3
+        assert breaker.failures == 0
+        assert breaker.get_state() == CircuitState.CLOSED
+    
+    def test_call_sync_opens_and_rejects(self):
+        """Test call_sync counts failures and rejects while OPEN."""
+        breaker = CircuitBreaker(failure_threshold=2, timeout=60)
+        
+        def failing_func():
+            raise ValueError("Test error")
+        
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                breaker.call_sync(failing_func)
+        
+        assert breaker.get_state() == CircuitState.OPEN
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.call_sync(lambda: "ok")
+    
+    def test_call_sync_half_open_probe(self):
+        """Test call_sync closes the circuit after a successful probe."""
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, timeout=1, clock=lambda: clock[0])
+        
+        def failing_func():
+            raise ValueError("Test error")
+        
+        with pytest.raises(ValueError):
+            breaker.call_sync(failing_func)
+        
+        clock[0] += 2
+        assert breaker.call_sync(lambda: "ok") == "ok"
+        assert breaker.get_state() == CircuitState.CLOSED
+        assert breaker._probe_in_flight is False
@@ -0,0 +1,85 @@
+"""Tests for configuration loading."""
+
+import pytest
+
+from opa_quotes_streamer import config
+from opa_quotes_streamer.config import (
+    Settings,
+    _load_tickers_from_config_file,
+    _reset_ticker_cache,
+    get_settings,
+    load_tickers_from_yaml,
+)
+
+
+class TestLoadTickersFromYaml:
+    """Test ticker loading from env var and YAML config."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        _reset_ticker_cache()
+        yield
+        _reset_ticker_cache()
+
+    def test_env_var_takes_precedence(self, monkeypatch):
+        """Test TICKERS env var overrides the config file."""
+        monkeypatch.setenv("TICKERS", "AAPL,MSFT")
+
+        assert load_tickers_from_yaml() == "AAPL,MSFT"
+
+    def test_env_var_not_cached(self, monkeypatch):
+        """Test changes to TICKERS are seen without resetting the cache."""
+        monkeypatch.setenv("TICKERS", "AAPL")
+        assert load_tickers_from_yaml() == "AAPL"
+
+        monkeypatch.setenv("TICKERS", "TSLA")
+        assert load_tickers_from_yaml() == "TSLA"
+
+    def test_config_file_parsed_once(self, monkeypatch, mocker):
+        """Test the YAML file is only parsed on the first call."""
+        monkeypatch.delenv("TICKERS", raising=False)
+        spy = mocker.spy(config.yaml, "load")
+
+        first = load_tickers_from_yaml()
+        second = load_tickers_from_yaml()
+
+        assert first == second
+        assert spy.call_count <= 1
+        assert _load_tickers_from_config_file.cache_info().hits == 1
+
+
+class TestGetSettings:
+    """Test settings singleton access."""
+
+    @pytest.fixture(autouse=True)
+    def reset_settings(self):
+        get_settings.cache_clear()
+        yield
+        get_settings.cache_clear()
+
+    def test_returns_same_instance(self):
+        """Test repeated calls return the cached instance."""
+        assert get_settings() is get_settings()
+
+    def test_cache_clear_reloads_environment(self, monkeypatch):
+        """Test cache_clear() picks up a changed environment."""
+        monkeypatch.setenv("POLLING_INTERVAL", "7")
+        get_settings.cache_clear()
+
+        assert get_settings().polling_interval == 7
+
+
+class TestSettingsTickersList:
+    """Test parsed ticker list on Settings."""
+
+    def test_tickers_list_parsed(self):
+        """Test comma-separated tickers are split and stripped."""
+        settings = Settings(tickers="AAPL, MSFT ,GOOGL")
+
+        assert settings.tickers_list == ("AAPL", "MSFT", "GOOGL")
+
+    def test_tickers_list_cached(self):
+        """Test the parsed tuple is computed once per instance."""
+        settings = Settings(tickers="AAPL,MSFT")
+
+        assert settings.tickers_list is settings.tickers_list
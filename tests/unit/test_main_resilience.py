@@ -14,7 +14,7 @@ async def test_streaming_service_starts_when_pipeline_logger_db_unavailable():
     Test that StreamingService can start even when PipelineLogger 
     cannot connect to database (DB unavailable in integration environment).
     """
-    with patch('opa_quotes_streamer.main.PipelineLogger') as mock_pipeline_logger_class:
+    with patch('opa_shared_utils.utils.pipeline_logger.PipelineLogger') as mock_pipeline_logger_class:
         # Mock PipelineLogger.start() to raise OperationalError
         mock_logger_instance = Mock()
         mock_logger_instance.start.side_effect = OperationalError(
@@ -26,9 +26,9 @@ async def test_streaming_service_starts_when_pipeline_logger_db_unavailable():
         mock_pipeline_logger_class.return_value = mock_logger_instance
         
         # Mock other components
-        with patch('opa_quotes_streamer.main.YFinanceSource'), \
-             patch('opa_quotes_streamer.main.StoragePublisher'), \
-             patch('opa_quotes_streamer.main.StreamingMetrics') as mock_metrics:
+        with patch('opa_quotes_streamer.sources.yfinance_source.YFinanceSource'), \
+             patch('opa_quotes_streamer.publishers.storage_publisher.StoragePublisher'), \
+             patch('opa_quotes_streamer.metrics.StreamingMetrics') as mock_metrics:
             
             mock_metrics_instance = Mock()
             mock_metrics_instance.start_metrics_server = Mock()
@@ -57,7 +57,7 @@ async def test_streaming_service_completes_when_pipeline_logger_db_unavailable()
     Test that StreamingService can complete gracefully even when 
     PipelineLogger.complete() fails due to DB unavailability.
     """
-    with patch('opa_quotes_streamer.main.PipelineLogger') as mock_pipeline_logger_class:
+    with patch('opa_shared_utils.utils.pipeline_logger.PipelineLogger') as mock_pipeline_logger_class:
         # Mock PipelineLogger
         mock_logger_instance = Mock()
         mock_logger_instance.start = Mock()  # start succeeds
@@ -69,9 +69,9 @@ async def test_streaming_service_completes_when_pipeline_logger_db_unavailable()
         mock_pipeline_logger_class.return_value = mock_logger_instance
         
         # Mock other components
-        with patch('opa_quotes_streamer.main.YFinanceSource'), \
-             patch('opa_quotes_streamer.main.StoragePublisher'), \
-             patch('opa_quotes_streamer.main.StreamingMetrics'):
+        with patch('opa_quotes_streamer.sources.yfinance_source.YFinanceSource'), \
+             patch('opa_quotes_streamer.publishers.storage_publisher.StoragePublisher'), \
+             patch('opa_quotes_streamer.metrics.StreamingMetrics'):
             
             # Create service
             service = StreamingService()
@@ -90,7 +90,7 @@ async def test_streaming_service_handles_exception_with_db_unavailable():
     Test that StreamingService handles exceptions in stream_loop 
     gracefully even when PipelineLogger.complete() fails.
     """
-    with patch('opa_quotes_streamer.main.PipelineLogger') as mock_pipeline_logger_class:
+    with patch('opa_shared_utils.utils.pipeline_logger.PipelineLogger') as mock_pipeline_logger_class:
         # Mock PipelineLogger with complete() failing
         mock_logger_instance = Mock()
         mock_logger_instance.start = Mock()
@@ -102,9 +102,9 @@ async def test_streaming_service_handles_exception_with_db_unavailable():
         mock_pipeline_logger_class.return_value = mock_logger_instance
         
         # Mock other components
-        with patch('opa_quotes_streamer.main.YFinanceSource'), \
-             patch('opa_quotes_streamer.main.StoragePublisher'), \
-             patch('opa_quotes_streamer.main.StreamingMetrics') as mock_metrics:
+        with patch('opa_quotes_streamer.sources.yfinance_source.YFinanceSource'), \
+             patch('opa_quotes_streamer.publishers.storage_publisher.StoragePublisher'), \
+             patch('opa_quotes_streamer.metrics.StreamingMetrics') as mock_metrics:
             
             mock_metrics_instance = Mock()
             mock_metrics_instance.start_metrics_server = Mock()
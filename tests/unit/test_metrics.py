@@ -89,6 +89,21 @@ class TestStreamingMetrics:
         # Verify errors were recorded (exact count checking requires registry access)
         assert metrics.errors_total is not None
     
+    def test_record_error_counts_per_type(self):
+        """Test prebound and ad-hoc error labels both count correctly."""
+        metrics = StreamingMetrics()
+        
+        metrics.record_error(error_type="publish")
+        metrics.record_error(error_type="publish")
+        metrics.record_error(error_type="parse")
+        
+        assert REGISTRY.get_sample_value(
+            'streamer_errors_total', {'error_type': 'publish'}
+        ) == 2
+        assert REGISTRY.get_sample_value(
+            'streamer_errors_total', {'error_type': 'parse'}
+        ) == 1
+    
     def test_set_active_tickers(self):
         """Test setting active tickers gauge."""
         metrics = StreamingMetrics()
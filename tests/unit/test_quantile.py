@@ -0,0 +1,74 @@
+"""Unit tests for streaming quantile estimators."""
+
+import random
+
+import numpy as np
+import pytest
+from opa_quotes_streamer.utils.quantile import P2Quantile, StreamingPercentiles
+
+
+class TestP2Quantile:
+    """Test suite for P2Quantile class."""
+    
+    def test_init_invalid_quantile(self):
+        """Test initialization rejects quantiles outside (0, 1)."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            P2Quantile(0)
+        
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            P2Quantile(1.5)
+    
+    def test_value_empty(self):
+        """Test estimate is 0.0 before any observation."""
+        assert P2Quantile(0.5).value() == 0.0
+    
+    def test_value_fewer_than_five_samples(self):
+        """Test exact nearest-lower value during bootstrap."""
+        estimator = P2Quantile(0.5)
+        for x in (30.0, 10.0, 20.0):
+            estimator.update(x)
+        
+        assert estimator.count == 3
+        assert estimator.value() == 20.0
+    
+    @pytest.mark.parametrize("quantile", [0.5, 0.95, 0.99])
+    def test_estimate_close_to_exact(self, quantile):
+        """Test estimate converges to the exact quantile on a large stream."""
+        rng = random.Random(42)
+        data = [rng.expovariate(1 / 100) for _ in range(20000)]
+        
+        estimator = P2Quantile(quantile)
+        for x in data:
+            estimator.update(x)
+        
+        exact = float(np.percentile(data, quantile * 100))
+        assert estimator.value() == pytest.approx(exact, rel=0.05)
+    
+    def test_constant_stream(self):
+        """Test constant input yields that constant."""
+        estimator = P2Quantile(0.99)
+        for _ in range(100):
+            estimator.update(7.0)
+        
+        assert estimator.value() == 7.0
+
+
+class TestStreamingPercentiles:
+    """Test suite for StreamingPercentiles class."""
+    
+    def test_tracks_requested_percentiles(self):
+        """Test all requested percentiles are tracked and ordered."""
+        tracker = StreamingPercentiles((50, 95, 99))
+        for x in range(1, 1001):
+            tracker.update(float(x))
+        
+        assert tracker.count == 1000
+        assert tracker.percentile(50) == pytest.approx(500, rel=0.05)
+        assert tracker.percentile(50) < tracker.percentile(95) < tracker.percentile(99)
+    
+    def test_untracked_percentile_raises(self):
+        """Test requesting an untracked percentile raises KeyError."""
+        tracker = StreamingPercentiles((50,))
+        
+        with pytest.raises(KeyError):
+            tracker.percentile(99)
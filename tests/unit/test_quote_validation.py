@@ -236,3 +236,40 @@ class TestQuoteContractValidation:
                 timestamp=datetime.now(timezone.utc),
                 source="yfinance"
             )
+    
+    def test_whitespace_stripped(self):
+        """Surrounding whitespace stripped from ticker and source."""
+        quote = Quote(
+            ticker="  aapl ",
+            price=100.0,
+            volume=1000,
+            timestamp=datetime.now(timezone.utc),
+            source=" YFinance "
+        )
+        assert quote.ticker == "AAPL"
+        assert quote.source == "yfinance"
+    
+    def test_unknown_field_rejected(self):
+        """Unknown fields rejected (extra='forbid')."""
+        with pytest.raises(ValidationError):
+            Quote(
+                ticker="AAPL",
+                price=100.0,
+                volume=1000,
+                timestamp=datetime.now(timezone.utc),
+                source="yfinance",
+                symbol="AAPL"
+            )
+    
+    def test_quote_is_immutable(self):
+        """Quotes are frozen and hashable."""
+        quote = Quote(
+            ticker="AAPL",
+            price=100.0,
+            volume=1000,
+            timestamp=datetime.now(timezone.utc),
+            source="yfinance"
+        )
+        with pytest.raises(ValidationError):
+            quote.price = 200.0
+        assert hash(quote) == hash(quote)
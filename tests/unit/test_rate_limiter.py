@@ -3,6 +3,7 @@
 import pytest
 import asyncio
 import time
+from unittest.mock import patch
 from opa_quotes_streamer.utils.rate_limiter import RateLimiter
 
 
@@ -65,6 +66,112 @@ class TestRateLimiter:
         # Should wait ~0.5 seconds for refill
         assert 0.4 <= elapsed <= 0.7
     
+    @pytest.mark.asyncio
+    async def test_acquire_wakes_once_when_token_due(self):
+        """Test a waiter is woken once, when the token is due, not by polling."""
+        limiter = RateLimiter(max_requests_per_hour=3600)  # 1 token/second
+        limiter.tokens = 0.5
+        
+        with patch.object(limiter, '_wake_waiters', wraps=limiter._wake_waiters) as wake:
+            start = time.monotonic()
+            result = await limiter.acquire()
+            elapsed = time.monotonic() - start
+        
+        assert result is True
+        assert 0.4 <= elapsed <= 0.7
+        assert wake.call_count <= 2  # One timer (+ clock jitter retry)
+    
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_fifo_order(self):
+        """Test queued callers get tokens in arrival order."""
+        limiter = RateLimiter(max_requests_per_hour=36000)  # 10 tokens/second
+        limiter.tokens = 0.0
+        order = []
+        
+        async def worker(i):
+            await limiter.acquire()
+            order.append(i)
+        
+        await asyncio.gather(*[worker(i) for i in range(3)])
+        
+        assert order == [0, 1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_leaves_queue(self):
+        """Test a timed-out waiter is dropped and does not consume a token."""
+        limiter = RateLimiter(max_requests_per_hour=36000)  # 10 tokens/second
+        limiter.tokens = 0.0
+        
+        assert await limiter.acquire(timeout=0.01) is False
+        assert not limiter._waiters
+        assert await limiter.acquire() is True
+    
+    @pytest.mark.asyncio
+    async def test_timed_out_head_rearms_wake_for_next_waiter(self):
+        """Test the next waiter is not left on the timed-out head's deadline."""
+        limiter = RateLimiter(max_requests_per_hour=36000)  # 10 tokens/second
+        limiter.tokens = 0.0
+        
+        start = time.monotonic()
+        head, second = await asyncio.gather(
+            limiter.acquire_many(5, timeout=0.05),  # Would be due at 0.5s
+            limiter.acquire(timeout=1.0)            # Due at 0.1s
+        )
+        elapsed = time.monotonic() - start
+        
+        assert head is False
+        assert second is True
+        assert elapsed < 0.35
+    
+    @pytest.mark.asyncio
+    async def test_acquire_many(self):
+        """Test acquiring a batch of tokens in one call."""
+        limiter = RateLimiter(max_requests_per_hour=100)
+        
+        assert await limiter.acquire_many(20) is True
+        assert limiter.tokens == pytest.approx(80.0, abs=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_acquire_many_waits_for_deficit(self):
+        """Test acquire_many waits once for the whole shortfall."""
+        limiter = RateLimiter(max_requests_per_hour=36000)  # 10 tokens/second
+        limiter.tokens = 1.0
+        
+        start = time.monotonic()
+        assert await limiter.acquire_many(3) is True
+        elapsed = time.monotonic() - start
+        
+        assert 0.15 <= elapsed <= 0.4  # 2 missing tokens at 10/s
+        assert await limiter.acquire_many(3, timeout=0.05) is False
+    
+    @pytest.mark.asyncio
+    async def test_acquire_many_invalid_count(self):
+        """Test acquire_many rejects counts outside 1..capacity."""
+        limiter = RateLimiter(max_requests_per_hour=10)
+        
+        with pytest.raises(ValueError, match="between 1 and 10"):
+            await limiter.acquire_many(0)
+        with pytest.raises(ValueError, match="between 1 and 10"):
+            await limiter.acquire_many(11)
+    
+    def test_try_acquire(self):
+        """Test non-blocking acquisition."""
+        limiter = RateLimiter(max_requests_per_hour=100)
+        limiter.tokens = 2.5
+        
+        assert limiter.try_acquire(2) is True
+        assert limiter.try_acquire() is False
+        assert limiter.tokens == pytest.approx(0.5, abs=0.01)
+    
+    def test_try_acquire_invalid_count(self):
+        """Test try_acquire rejects counts outside 1..capacity."""
+        limiter = RateLimiter(max_requests_per_hour=10)
+        
+        for n in (-5, 0, 11):
+            with pytest.raises(ValueError, match="between 1 and 10"):
+                limiter.try_acquire(n)
+        assert limiter.tokens == 10.0
+    
     @pytest.mark.asyncio
     async def test_acquire_with_timeout(self):
         """Test acquire with timeout."""
@@ -81,31 +188,46 @@ class TestRateLimiter:
     @pytest.mark.asyncio
     async def test_refill_over_time(self):
         """Test automatic token refilling."""
-        limiter = RateLimiter(max_requests_per_hour=3600)  # 1 token/second
+        clock = [0]
+        limiter = RateLimiter(max_requests_per_hour=3600, clock=lambda: clock[0])  # 1 token/second
         
         # Start with 50 tokens
         limiter.tokens = 50.0
         
-        # Wait 2 seconds
-        await asyncio.sleep(2.0)
+        # Advance 2 seconds
+        clock[0] += 2_000_000_000
         
         # Trigger refill by checking available tokens
-        await limiter._refill()
+        limiter._refill()
         
-        # Should have ~52 tokens now (50 + 2)
-        assert 51.5 <= limiter.tokens <= 52.5
+        # Should have 52 tokens now (50 + 2)
+        assert limiter.tokens == 52.0
+    
+    def test_refill_exact_with_many_small_steps(self):
+        """Test integer refill does not drift when refilled very often."""
+        clock = [0]
+        limiter = RateLimiter(max_requests_per_hour=2000, clock=lambda: clock[0])
+        limiter.tokens = 0.0
+        
+        # 18 ms (exactly 1/100 token at 2000/h) in 1 µs steps, each < 1 microtoken
+        for _ in range(18_000):
+            clock[0] += 1_000
+            limiter._refill()
+        
+        assert limiter.tokens_u == 10_000
     
     @pytest.mark.asyncio
     async def test_refill_does_not_exceed_capacity(self):
         """Test that refill doesn't exceed capacity."""
-        limiter = RateLimiter(max_requests_per_hour=100)
+        clock = [0]
+        limiter = RateLimiter(max_requests_per_hour=100, clock=lambda: clock[0])
         
         # Start at capacity
         limiter.tokens = 100.0
         
-        # Wait and refill
-        await asyncio.sleep(0.5)
-        await limiter._refill()
+        # Advance and refill
+        clock[0] += 500_000_000
+        limiter._refill()
         
         # Should still be at capacity
         assert limiter.tokens <= 100.0
@@ -1,10 +1,14 @@
 """Unit tests for RedisPublisher."""
 
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 import json
 from datetime import datetime, timezone
 
+import redis
+
+from opa_quotes_streamer.publishers import redis_publisher
 from opa_quotes_streamer.publishers.redis_publisher import RedisPublisher
 from opa_quotes_streamer.models.quote import Quote
 from opa_quotes_streamer.utils.circuit_breaker import CircuitBreakerOpenError
@@ -37,6 +41,30 @@ def sample_quotes():
     ]
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Isolate tests from Redis clients cached by earlier tests."""
+    redis_publisher._CLIENT_CACHE.clear()
+    redis_publisher._CLIENT_REFS.clear()
+    yield
+    redis_publisher._CLIENT_CACHE.clear()
+    redis_publisher._CLIENT_REFS.clear()
+
+
+def mock_redis_pipeline(execute_result=None, execute_error=None):
+    """Create a mocked Redis client whose pipeline returns execute_result."""
+    mock_pipe = Mock()
+    if execute_error is not None:
+        mock_pipe.execute = AsyncMock(side_effect=execute_error)
+    else:
+        mock_pipe.execute = AsyncMock(return_value=execute_result)
+    
+    mock_redis = AsyncMock()
+    mock_redis.ping = AsyncMock()
+    mock_redis.pipeline = Mock(return_value=mock_pipe)
+    return mock_redis, mock_pipe
+
+
 class TestRedisPublisher:
     """Test suite for RedisPublisher class."""
     
@@ -83,12 +111,10 @@ class TestRedisPublisher:
             client = await publisher._get_client()
             
             assert client == mock_redis
-            mock_from_url_patch.assert_called_once_with(
-                "redis://localhost:6381",
-                encoding="utf-8",
-                decode_responses=True
-            )
-            mock_redis.ping.assert_awaited_once()
+            mock_from_url_patch.assert_called_once_with("redis://localhost:6381")
+            mock_redis.ping.assert_not_awaited()  # Liveness is checked in background
+            assert publisher._health_task is not None
+            await publisher.close()
     
     @pytest.mark.asyncio
     async def test_get_client_reuses_connection(self):
@@ -105,61 +131,109 @@ class TestRedisPublisher:
             assert client == mock_redis
             mock_from_url.assert_not_called()  # Should not create new connection
     
-    def test_quote_to_cloudevent_format(self, sample_quotes):
-        """Test CloudEvents 1.0 format conversion."""
+    def test_encode_cloudevent_format(self, sample_quotes):
+        """Test CloudEvents 1.0 message encoding."""
         publisher = RedisPublisher()
-        quote = sample_quotes[0]
         
-        with patch('opa_quotes_streamer.publishers.redis_publisher.uuid4') as mock_uuid, \
+        with patch('opa_quotes_streamer.publishers.redis_publisher._next_event_id',
+                   return_value="test-event-1234"):
+            encoded = publisher._encode_cloudevent(sample_quotes[0], b"2025-01-19T16:00:00Z")
+        
+        assert encoded == (
+            b'{"specversion":"1.0","type":"com.opamachine.quotes.price-updated",'
+            b'"source":"opa-quotes-streamer","id":"test-event-1234",'
+            b'"time":"2025-01-19T16:00:00Z","datacontenttype":"application/json",'
+            b'"data":{"ticker":"AAPL","price":178.45,"volume":52341000,'
+            b'"timestamp":"2025-01-19T15:30:00Z","source":"yfinance","bid":178.44,'
+            b'"ask":178.46,"open":175.0,"high":179.0,"low":174.5,"previous_close":176.0}}'
+        )
+    
+    def test_encode_cloudevent_optional_fields(self, sample_quotes):
+        """Test CloudEvents encoding with optional null fields."""
+        publisher = RedisPublisher()
+        
+        with patch('opa_quotes_streamer.publishers.redis_publisher._next_event_id',
+                   return_value="test-event-1234"):
+            encoded = publisher._encode_cloudevent(sample_quotes[1], b"2025-01-19T16:00:00Z")
+        
+        assert encoded.endswith(
+            b'"data":{"ticker":"MSFT","price":350.2,"volume":89234000,'
+            b'"timestamp":"2025-01-19T15:30:00Z","source":"yfinance","bid":null,'
+            b'"ask":null,"open":null,"high":null,"low":null,"previous_close":null}}'
+        )
+    
+    def test_event_ids_unique(self, sample_quotes):
+        """Test consecutive events get distinct ids with a shared process prefix."""
+        publisher = RedisPublisher()
+        
+        first = json.loads(publisher._encode_cloudevent(sample_quotes[0], b"t"))["id"]
+        second = json.loads(publisher._encode_cloudevent(sample_quotes[1], b"t"))["id"]
+        
+        assert first != second
+        assert first.rsplit("-", 1)[0] == second.rsplit("-", 1)[0]
+    
+    @pytest.mark.asyncio
+    async def test_publish_batch_event_time_format(self, sample_quotes):
+        """Test event time uses the same Z form as data.timestamp."""
+        publisher = RedisPublisher()
+        
+        with patch.object(publisher, '_publish_events', new=AsyncMock(return_value=[1, 1])) as send, \
              patch('opa_quotes_streamer.publishers.redis_publisher.datetime') as mock_datetime:
-            
-            mock_uuid.return_value = "test-uuid-1234"
             mock_datetime.now.return_value = datetime(2025, 1, 19, 16, 0, 0, tzinfo=timezone.utc)
-            
-            event = publisher._quote_to_cloudevent(quote)
-            
-            # Validate CloudEvents 1.0 structure
-            assert event["specversion"] == "1.0"
-            assert event["type"] == "com.opamachine.quotes.price-updated"
-            assert event["source"] == "opa-quotes-streamer"
-            assert event["id"] == "test-uuid-1234"
-            assert event["datacontenttype"] == "application/json"
-            
-            # Validate data payload
-            assert event["data"]["ticker"] == "AAPL"
-            assert event["data"]["price"] == 178.45
-            assert event["data"]["volume"] == 52341000
-            assert event["data"]["source"] == "yfinance"
-            assert event["data"]["bid"] == 178.44
-            assert event["data"]["ask"] == 178.46
-            assert event["data"]["open"] == 175.00
-            assert event["data"]["high"] == 179.00
-            assert event["data"]["low"] == 174.50
-            assert event["data"]["previous_close"] == 176.00
+            await publisher.publish_batch(sample_quotes)
+        
+        event = json.loads(send.call_args[0][0][0])
+        assert event["time"] == "2025-01-19T16:00:00Z"
+        assert event["data"]["timestamp"] == "2025-01-19T15:30:00Z"
     
-    def test_quote_to_cloudevent_optional_fields(self, sample_quotes):
-        """Test CloudEvents format with optional null fields."""
-        publisher = RedisPublisher()
-        quote = sample_quotes[1]  # MSFT without optional fields
+    @pytest.mark.asyncio
+    async def test_publish_batch_batch_mode(self, sample_quotes):
+        """Test batch mode sends one CloudEvents JSON batch message."""
+        publisher = RedisPublisher(batch_mode=True)
         
-        event = publisher._quote_to_cloudevent(quote)
+        mock_redis, mock_pipe = mock_redis_pipeline()
+        mock_redis.publish = AsyncMock(return_value=1)
+        
+        async def mock_from_url(*args, **kwargs):
+            return mock_redis
         
-        # Optional fields should be None
-        assert event["data"]["bid"] is None
-        assert event["data"]["ask"] is None
-        assert event["data"]["open"] is None
-        assert event["data"]["high"] is None
-        assert event["data"]["low"] is None
-        assert event["data"]["previous_close"] is None
+        with patch('redis.asyncio.from_url', side_effect=mock_from_url):
+            result = await publisher.publish_batch(sample_quotes)
+        
+        assert result == 2
+        mock_redis.pipeline.assert_not_called()
+        mock_redis.publish.assert_awaited_once()
+        
+        channel, payload = mock_redis.publish.call_args[0]
+        assert channel == b"quotes.realtime"
+        
+        events = json.loads(payload)
+        assert [e["data"]["ticker"] for e in events] == ["AAPL", "MSFT"]
+        assert events[0]["id"] != events[1]["id"]
+        assert events[0]["time"] == events[1]["time"]
+    
+    @pytest.mark.asyncio
+    async def test_publish_batch_batch_mode_error(self, sample_quotes):
+        """Test batch mode counts the whole batch as failed on Redis error."""
+        publisher = RedisPublisher(batch_mode=True)
+        
+        mock_redis, _ = mock_redis_pipeline()
+        mock_redis.publish = AsyncMock(side_effect=redis.ConnectionError("down"))
+        
+        async def mock_from_url(*args, **kwargs):
+            return mock_redis
+        
+        with patch('redis.asyncio.from_url', side_effect=mock_from_url):
+            result = await publisher.publish_batch(sample_quotes)
+        
+        assert result == 0
     
     @pytest.mark.asyncio
     async def test_publish_batch_success(self, sample_quotes):
         """Test successful batch publishing to Redis."""
         publisher = RedisPublisher()
         
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock()
-        mock_redis.publish = AsyncMock(return_value=1)  # 1 subscriber
+        mock_redis, mock_pipe = mock_redis_pipeline([1, 1])  # 1 subscriber each
         
         async def mock_from_url(*args, **kwargs):
             return mock_redis
@@ -168,13 +242,15 @@ class TestRedisPublisher:
             result = await publisher.publish_batch(sample_quotes)
         
         assert result == 2  # Both quotes published
-        assert mock_redis.publish.call_count == 2
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert mock_pipe.publish.call_count == 2
+        mock_pipe.execute.assert_awaited_once()  # Single round-trip
         
         # Verify published data format
-        first_call = mock_redis.publish.call_args_list[0]
+        first_call = mock_pipe.publish.call_args_list[0]
         channel, payload = first_call[0]
         
-        assert channel == "quotes.realtime"
+        assert channel == b"quotes.realtime"
         
         event = json.loads(payload)
         assert event["specversion"] == "1.0"
@@ -186,14 +262,12 @@ class TestRedisPublisher:
         """Test publishing with Redis connection error."""
         publisher = RedisPublisher()
         
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock()
-        mock_redis.publish = AsyncMock(side_effect=Exception("Connection refused"))
+        mock_redis, _ = mock_redis_pipeline(execute_error=Exception("Connection refused"))
         
         with patch('redis.asyncio.from_url', return_value=mock_redis):
             result = await publisher.publish_batch(sample_quotes)
         
-        # Should handle error gracefully and continue
+        # Should handle error gracefully
         assert result == 0  # No quotes published due to error
     
     @pytest.mark.asyncio
@@ -201,12 +275,9 @@ class TestRedisPublisher:
         """Test publishing with partial failures."""
         publisher = RedisPublisher()
         
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock()
-        
-        # First publish fails, second succeeds
-        mock_redis.publish = AsyncMock(side_effect=[
-            Exception("Temporary error"),
+        # First publish fails, second succeeds (per-command pipeline results)
+        mock_redis, _ = mock_redis_pipeline([
+            redis.ResponseError("Temporary error"),
             1  # Success
         ])
         
@@ -236,18 +307,95 @@ class TestRedisPublisher:
         
         assert result == 0  # No quotes published
     
+    @pytest.mark.asyncio
+    async def test_get_client_shared_across_publishers(self):
+        """Test publishers on the same URL share one Redis client."""
+        mock_redis = AsyncMock()
+        mock_redis.ping = AsyncMock()
+        
+        async def mock_from_url(*args, **kwargs):
+            return mock_redis
+        
+        with patch('redis.asyncio.from_url', side_effect=mock_from_url) as mock_from_url_patch:
+            first = await RedisPublisher()._get_client()
+            second = await RedisPublisher(channel="other")._get_client()
+        
+        assert first is second
+        mock_from_url_patch.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_shared_client_closed_by_last_publisher(self):
+        """Test the shared client stays open until its last publisher closes."""
+        mock_redis = AsyncMock()
+        
+        async def mock_from_url(*args, **kwargs):
+            return mock_redis
+        
+        first = RedisPublisher(health_check_interval=0)
+        second = RedisPublisher(channel="other", health_check_interval=0)
+        with patch('redis.asyncio.from_url', side_effect=mock_from_url) as mock_from_url_patch:
+            await first._get_client()
+            await second._get_client()
+            
+            await first.close()
+            mock_redis.aclose.assert_not_awaited()
+            third = RedisPublisher(health_check_interval=0)
+            assert await third._get_client() is mock_redis
+            mock_from_url_patch.assert_called_once()
+        
+        await second.close()
+        mock_redis.aclose.assert_not_awaited()
+        await third.close()
+        mock_redis.aclose.assert_awaited_once()
+        assert not redis_publisher._CLIENT_CACHE
+    
+    @pytest.mark.asyncio
+    async def test_health_loop_records_failures(self):
+        """Test failed background pings count against the circuit breaker."""
+        publisher = RedisPublisher(health_check_interval=0.01)
+        
+        mock_redis = AsyncMock()
+        mock_redis.ping = AsyncMock(side_effect=redis.ConnectionError("down"))
+        
+        async def mock_from_url(*args, **kwargs):
+            return mock_redis
+        
+        with patch('redis.asyncio.from_url', side_effect=mock_from_url):
+            await publisher._get_client()
+            await asyncio.sleep(0.05)
+            await publisher.close()
+        
+        assert mock_redis.ping.await_count >= 1
+        assert publisher._circuit_breaker.get_failure_count() >= 1
+        assert publisher._health_task is None
+    
+    @pytest.mark.asyncio
+    async def test_health_loop_disabled(self):
+        """Test health_check_interval=0 starts no background task."""
+        publisher = RedisPublisher(health_check_interval=0)
+        
+        mock_redis = AsyncMock()
+        
+        async def mock_from_url(*args, **kwargs):
+            return mock_redis
+        
+        with patch('redis.asyncio.from_url', side_effect=mock_from_url):
+            await publisher._get_client()
+        
+        assert publisher._health_task is None
+    
     @pytest.mark.asyncio
     async def test_close_connection(self):
         """Test closing Redis connection."""
         publisher = RedisPublisher()
         
         mock_redis = AsyncMock()
-        mock_redis.close = AsyncMock()
+        mock_redis.aclose = AsyncMock()
         publisher._client = mock_redis
         
         await publisher.close()
         
-        mock_redis.close.assert_awaited_once()
+        mock_redis.aclose.assert_awaited_once()
         assert publisher._client is None
     
     @pytest.mark.asyncio
@@ -265,9 +413,7 @@ class TestRedisPublisher:
         """Test that Prometheus metrics are recorded on success."""
         publisher = RedisPublisher()
         
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock()
-        mock_redis.publish = AsyncMock(return_value=1)
+        mock_redis, _ = mock_redis_pipeline([1, 1])
         
         with patch('redis.asyncio.from_url', return_value=mock_redis), \
              patch('opa_quotes_streamer.publishers.redis_publisher.REDIS_PUBLISHES_TOTAL') as mock_counter, \
@@ -284,9 +430,7 @@ class TestRedisPublisher:
         """Test that error metrics are recorded on failure."""
         publisher = RedisPublisher()
         
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock()
-        mock_redis.publish = AsyncMock(side_effect=Exception("Connection error"))
+        mock_redis, _ = mock_redis_pipeline(execute_error=Exception("Connection error"))
         
         with patch('redis.asyncio.from_url', return_value=mock_redis), \
              patch('opa_quotes_streamer.publishers.redis_publisher.REDIS_PUBLISH_ERRORS_TOTAL') as mock_error_counter:
@@ -1,5 +1,6 @@
 """Unit tests for StoragePublisher."""
 
+import json
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import httpx
@@ -212,8 +213,10 @@ class TestStoragePublisher:
             
             # Verify payload structure
             call_args = mock_post.call_args
-            assert call_args[1]['json']['quotes'] is not None
-            assert len(call_args[1]['json']['quotes']) == 2
+            payload = json.loads(call_args[1]['content'])
+            assert payload['quotes'] is not None
+            assert len(payload['quotes']) == 2
+            assert call_args[1]['headers']['Content-Type'] == "application/json"
             
             # Verify URL includes /v1 prefix
             assert call_args[0][0] == "http://localhost:8000/v1/quotes/batch"
@@ -228,12 +231,36 @@ class TestStoragePublisher:
         mock_response.raise_for_status = Mock()
         
         with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = mock_client_class.return_value.__aenter__.return_value
+            mock_client = mock_client_class.return_value
             mock_client.post = AsyncMock(return_value=mock_response)
             
             await publisher._post_quotes(sample_quotes)
             
-            mock_client_class.assert_called_once_with(timeout=30)
+            mock_client_class.assert_called_once()
+            assert mock_client_class.call_args[1]['timeout'] == 30
+    
+    @pytest.mark.asyncio
+    async def test_post_quotes_reuses_client(self, sample_quotes):
+        """Test that one HTTP client is reused across batches and closed on close()."""
+        publisher = StoragePublisher("http://localhost:8000")
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"inserted": 2, "errors": 0}
+        mock_response.raise_for_status = Mock()
+        
+        with patch('httpx.AsyncClient') as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_client.aclose = AsyncMock()
+            
+            await publisher._post_quotes(sample_quotes)
+            await publisher._post_quotes(sample_quotes)
+            await publisher.close()
+            
+            mock_client_class.assert_called_once()
+            assert mock_client.post.await_count == 2
+            mock_client.aclose.assert_awaited_once()
+            assert publisher._client is None
     
     @pytest.mark.asyncio
     async def test_close(self):
@@ -322,15 +349,65 @@ class TestStoragePublisher:
             
             # Verify that serialization happened
             call_args = mock_post.call_args
-            quotes_data = call_args[1]['json']['quotes']
+            quotes_data = json.loads(call_args[1]['content'])['quotes']
             
             # Check first quote structure
             assert 'ticker' in quotes_data[0]
-            assert 'price' in quotes_data[0]
+            assert 'close' in quotes_data[0]  # price is sent as close
             assert 'volume' in quotes_data[0]
             assert 'timestamp' in quotes_data[0]
             assert 'source' in quotes_data[0]
     
+    def test_encode_payload_msgspec_matches_fallback(self, sample_quotes, monkeypatch):
+        """Test msgspec and pydantic-core encoders produce the same body."""
+        pytest.importorskip("msgspec")
+        from opa_quotes_streamer.publishers import storage_publisher
+        
+        fast = StoragePublisher._encode_payload(sample_quotes)
+        monkeypatch.setattr(storage_publisher, "StorageQuoteWire", None)
+        fallback = StoragePublisher._encode_payload(sample_quotes)
+        
+        assert fast == fallback
+        assert json.loads(fast)["quotes"][0]["close"] == 178.45
+    
+    def test_wire_fields_match_struct(self):
+        """Test the msgspec struct and the dict fallback share one schema."""
+        pytest.importorskip("msgspec")
+        from opa_quotes_streamer.publishers import storage_publisher
+        
+        assert storage_publisher.StorageQuoteWire.__struct_fields__ == \
+            storage_publisher._WIRE_FIELDS
+    
+    @pytest.mark.asyncio
+    async def test_post_quotes_msgpack(self, sample_quotes):
+        """Test msgpack content encoding sends a MessagePack body."""
+        msgspec = pytest.importorskip("msgspec")
+        publisher = StoragePublisher("http://localhost:8000", content_encoding="msgpack")
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"inserted": 2, "errors": 0}
+        mock_response.raise_for_status = Mock()
+        
+        with patch('httpx.AsyncClient') as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.post = AsyncMock(return_value=mock_response)
+            
+            await publisher._post_quotes(sample_quotes)
+            
+            call_args = mock_client.post.call_args
+            assert call_args[1]['headers']['Content-Type'] == "application/x-msgpack"
+            
+            body = msgspec.msgpack.decode(call_args[1]['content'])
+            expected = json.loads(StoragePublisher._encode_payload(sample_quotes))
+            assert [q["ticker"] for q in body["quotes"]] == ["AAPL", "MSFT"]
+            assert body["quotes"][0]["close"] == expected["quotes"][0]["close"]
+            assert isinstance(body["quotes"][0]["timestamp"], datetime)
+    
+    def test_invalid_content_encoding(self):
+        """Test unknown content encoding is rejected."""
+        with pytest.raises(ValueError, match="Unsupported content_encoding"):
+            StoragePublisher("http://localhost:8000", content_encoding="xml")
+    
     @pytest.mark.asyncio
     async def test_publish_batch_max_size_limit(self, sample_quotes):
         """INV-006: Batch exceeding 1000 quotes rejected."""
@@ -138,6 +138,66 @@ class TestYFinanceSource:
             with pytest.raises(YFinanceError, match="Failed to fetch quotes"):
                 await source.fetch_quotes(["AAPL"])
     
+    @pytest.mark.asyncio
+    async def test_fetch_with_retry_recovers_from_connection_error(self):
+        """Test transient connection errors are retried with backoff."""
+        source = YFinanceSource()
+        mock_data = pd.DataFrame({'Close': [178.45], 'Volume': [52341000]})
+        
+        with patch.object(
+            source, '_fetch_yfinance_data',
+            side_effect=[ConnectionError("reset"), mock_data]
+        ), patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            quotes = await source._fetch_with_retry(["AAPL"])
+        
+        assert len(quotes) == 1
+        mock_sleep.assert_awaited_once_with(1)
+    
+    @pytest.mark.asyncio
+    async def test_fetch_with_retry_gives_up_after_max_retries(self):
+        """Test the last connection error is raised after max_retries attempts."""
+        source = YFinanceSource(max_retries=3)
+        
+        with patch.object(
+            source, '_fetch_yfinance_data', side_effect=TimeoutError("slow")
+        ) as mock_fetch, patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(TimeoutError):
+                await source._fetch_with_retry(["AAPL"])
+        
+        assert mock_fetch.call_count == 3
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_fetch_with_retry_retries_download_connection_error(self):
+        """Test a network error from yf.download reaches the retry loop."""
+        source = YFinanceSource()
+        mock_data = pd.DataFrame({'Close': [178.45], 'Volume': [52341000]})
+        
+        with patch(
+            'opa_quotes_streamer.sources.yfinance_source.yf.download',
+            side_effect=[ConnectionError("reset"), mock_data]
+        ) as mock_download, patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            quotes = await source._fetch_with_retry(["AAPL"])
+        
+        assert len(quotes) == 1
+        assert mock_download.call_count == 2
+        mock_sleep.assert_awaited_once_with(1)
+    
+    @pytest.mark.asyncio
+    async def test_fetch_with_retry_retries_curl_timeout(self):
+        """Test curl_cffi timeouts (not builtin TimeoutError) are retried."""
+        curl_requests = pytest.importorskip("curl_cffi.requests")
+        source = YFinanceSource(max_retries=2)
+        
+        with patch(
+            'opa_quotes_streamer.sources.yfinance_source.yf.download',
+            side_effect=curl_requests.exceptions.Timeout("timed out")
+        ) as mock_download, patch('asyncio.sleep', new_callable=AsyncMock):
+            with pytest.raises(curl_requests.exceptions.Timeout):
+                await source._fetch_with_retry(["AAPL"])
+        
+        assert mock_download.call_count == 2
+    
     def test_fetch_yfinance_data_success(self):
         """Test _fetch_yfinance_data with mocked yfinance.download."""
         source = YFinanceSource()
@@ -147,11 +207,32 @@ class TestYFinanceSource:
             'Volume': [52341000]
         })
         
-        with patch('opa_quotes_streamer.sources.yfinance_source.yf.download', return_value=mock_df):
+        with patch('opa_quotes_streamer.sources.yfinance_source.yf.download', return_value=mock_df) as mock_download:
             result = source._fetch_yfinance_data(["AAPL"])
         
         assert not result.empty
         assert 'Close' in result.columns
+        # Daily bars only: current session plus previous close
+        assert mock_download.call_args[1]['period'] == "2d"
+        assert mock_download.call_args[1]['interval'] == "1d"
+    
+    @pytest.mark.asyncio
+    async def test_fetch_yfinance_data_reuses_session(self):
+        """Test the same HTTP session is passed to every download."""
+        pytest.importorskip("curl_cffi")
+        source = YFinanceSource()
+        mock_df = pd.DataFrame({'Close': [178.45], 'Volume': [52341000]})
+        
+        with patch('opa_quotes_streamer.sources.yfinance_source.yf.download', return_value=mock_df) as mock_download:
+            source._fetch_yfinance_data(["AAPL"])
+            source._fetch_yfinance_data(["MSFT"])
+        
+        first, second = (c[1]['session'] for c in mock_download.call_args_list)
+        assert first is not None
+        assert first is second
+        
+        await source.close()
+        assert source._session is None
     
     def test_fetch_yfinance_data_empty_result(self):
         """Test _fetch_yfinance_data when yfinance returns empty."""
@@ -206,6 +287,73 @@ class TestYFinanceSource:
         
         assert len(quotes) == 2
     
+    def test_convert_to_quotes_multi_index_fields(self):
+        """Test vectorized MultiIndex extraction of every Quote field."""
+        source = YFinanceSource()
+        
+        columns = pd.MultiIndex.from_product(
+            [['Close', 'High', 'Low', 'Open', 'Volume'], ['AAPL', 'MSFT']]
+        )
+        data = pd.DataFrame(
+            [
+                [177.0, 349.0, 178.0, 351.0, 176.0, 348.0, 176.5, 349.5, 100, 200],
+                [178.45, 350.20, 179.0, float('nan'), 177.5, 349.0, 177.0, 350.0, 52341000, 89234000],
+            ],
+            columns=columns
+        )
+        
+        quotes = source._convert_to_quotes(data, ["AAPL", "MSFT", "GOOGL"])
+        
+        assert [q.ticker for q in quotes] == ["AAPL", "MSFT"]  # GOOGL absent
+        fields = {"ticker", "price", "volume", "open", "high", "low", "previous_close", "source"}
+        assert quotes[0].model_dump(include=fields) == {
+            "ticker": "AAPL", "price": 178.45, "volume": 52341000, "open": 177.0,
+            "high": 179.0, "low": 177.5, "previous_close": 177.0, "source": "yfinance",
+        }
+        assert quotes[1].model_dump(include=fields) == {
+            "ticker": "MSFT", "price": 350.20, "volume": 89234000, "open": 350.0,
+            "high": None, "low": 349.0, "previous_close": 349.0, "source": "yfinance",
+        }
+        assert quotes[0].timestamp == quotes[1].timestamp
+    
+    def test_convert_to_quotes_single_ticker_fields(self):
+        """Test vectorized flat-column extraction with missing optional fields."""
+        source = YFinanceSource()
+        
+        data = pd.DataFrame({
+            'Close': [177.0, 178.45],
+            'Open': [176.5, pd.NA],
+            'High': [178.0, 179.0],
+            'Volume': [100, 52341000]
+        })
+        
+        quotes = source._convert_to_quotes(data, ["AAPL"])
+        
+        assert len(quotes) == 1
+        assert quotes[0].price == 178.45
+        assert quotes[0].volume == 52341000
+        assert quotes[0].high == 179.0
+        assert quotes[0].open is None
+        assert quotes[0].low is None
+        assert quotes[0].previous_close == 177.0
+    
+    def test_convert_to_quotes_drops_invalid_rows(self):
+        """Test batch validation drops only the tickers that fail validation."""
+        source = YFinanceSource()
+        
+        columns = pd.MultiIndex.from_product(
+            [['Close', 'Volume'], ['AAPL', 'MSFT']]
+        )
+        data = pd.DataFrame(
+            [[178.45, 0.0, 52341000, 89234000]],  # MSFT price must be > 0
+            columns=columns
+        )
+        
+        quotes = source._convert_to_quotes(data, ["AAPL", "MSFT"])
+        
+        assert len(quotes) == 1
+        assert quotes[0].ticker == "AAPL"
+    
     def test_convert_to_quotes_empty_dataframe(self):
         """Test conversion with empty DataFrame."""
         source = YFinanceSource()
@@ -215,7 +363,7 @@ class TestYFinanceSource:
         
         assert quotes == []
     
-    def test_create_quote_from_data_valid(self):
+    def test_convert_to_quotes_all_fields(self):
         """Test creating Quote from valid data."""
         source = YFinanceSource()
         
@@ -227,9 +375,10 @@ class TestYFinanceSource:
             'Low': [174.50]
         })
         
-        quote = source._create_quote_from_data("AAPL", data, data)
+        quotes = source._convert_to_quotes(data, ["AAPL"])
         
-        assert quote is not None
+        assert len(quotes) == 1
+        quote = quotes[0]
         assert quote.ticker == "AAPL"
         assert quote.price == 178.45
         assert quote.volume == 52341000
@@ -237,7 +386,7 @@ class TestYFinanceSource:
         assert quote.high == 179.00
         assert quote.low == 174.50
     
-    def test_create_quote_from_data_missing_values(self):
+    def test_convert_to_quotes_missing_values(self):
         """Test creating Quote with missing essential values."""
         source = YFinanceSource()
         
@@ -246,11 +395,11 @@ class TestYFinanceSource:
             'Volume': [pd.NA]
         })
         
-        quote = source._create_quote_from_data("AAPL", data, data)
+        quotes = source._convert_to_quotes(data, ["AAPL"])
         
-        assert quote is None
+        assert quotes == []
     
-    def test_create_quote_from_data_with_previous_close(self):
+    def test_convert_to_quotes_with_previous_close(self):
         """Test creating Quote with previous close data."""
         source = YFinanceSource()
         
@@ -260,11 +409,10 @@ class TestYFinanceSource:
             'Volume': [50000000, 52341000]
         })
         
-        latest = data.tail(1)
-        quote = source._create_quote_from_data("AAPL", latest, data)
+        quotes = source._convert_to_quotes(data, ["AAPL"])
         
-        assert quote is not None
-        assert quote.previous_close == 177.80
+        assert len(quotes) == 1
+        assert quotes[0].previous_close == 177.80
     
     @pytest.mark.asyncio
     async def test_close(self):
@@ -295,6 +443,44 @@ class TestYFinanceSource:
         assert len(quotes) == 1
         assert quotes[0].ticker == "AAPL"
     
+    @pytest.mark.asyncio
+    async def test_fetch_hooks_called_on_success(self):
+        """Test instrumentation hooks receive latency, count and batch."""
+        source = YFinanceSource()
+        source.on_fetch_latency = Mock()
+        source.on_quotes = Mock()
+        source.on_fetch_error = Mock()
+        
+        mock_data = pd.DataFrame({
+            'Close': [178.45],
+            'Volume': [52341000]
+        })
+        
+        with patch.object(source, '_fetch_yfinance_data', return_value=mock_data):
+            quotes = await source.fetch_quotes(["AAPL"])
+        
+        latency_ns, n_quotes = source.on_fetch_latency.call_args.args
+        assert isinstance(latency_ns, int) and latency_ns >= 0
+        assert n_quotes == 1
+        source.on_quotes.assert_called_once_with(quotes)
+        source.on_fetch_error.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_fetch_hooks_called_on_error(self):
+        """Test error hook fires and success hooks don't on failure."""
+        source = YFinanceSource()
+        source.on_fetch_latency = Mock()
+        source.on_quotes = Mock()
+        source.on_fetch_error = Mock()
+        
+        with patch.object(source, '_fetch_yfinance_data', side_effect=Exception("API Error")):
+            with pytest.raises(YFinanceError):
+                await source.fetch_quotes(["AAPL"])
+        
+        source.on_fetch_error.assert_called_once()
+        source.on_fetch_latency.assert_not_called()
+        source.on_quotes.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_integration_with_real_rate_limiter(self):
         """Test integration with real RateLimiter (not mocked)."""